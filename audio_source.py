@@ -4,12 +4,14 @@ Audio source abstractions for QuickScribe.
 import numpy as np
 from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import Optional, Type, Protocol
+from typing import Callable, Optional, Type, Protocol
 
 
 class AudioResult:
     """Base class for audio results with discrimination."""
 
+    __slots__ = ('result_type', 'sample_rate')
+
     def __init__(self, result_type: str, sample_rate: int):
         self.result_type = result_type
         self.sample_rate = sample_rate
@@ -18,6 +20,8 @@ class AudioResult:
 class AudioDataResult(AudioResult):
     """Result containing raw audio data."""
 
+    __slots__ = ('audio_data',)
+
     def __init__(self, audio_data: np.ndarray, sample_rate: int):
         super().__init__("audio_data", sample_rate)
         self.audio_data = audio_data
@@ -26,6 +30,8 @@ class AudioDataResult(AudioResult):
 class AudioFileResult(AudioResult):
     """Result containing path to audio file."""
 
+    __slots__ = ('file_path',)
+
     def __init__(self, file_path: str, sample_rate: int):
         super().__init__("audio_file", sample_rate)
         self.file_path = file_path
@@ -34,12 +40,35 @@ class AudioFileResult(AudioResult):
 class AudioTextResult(AudioResult):
     """Result containing transcribed text."""
 
+    __slots__ = ('transcribed_text', 'audio_data')
+
     def __init__(self, transcribed_text: str, sample_rate: int, audio_data: Optional[np.ndarray] = None):
         super().__init__("audio_text", sample_rate)
         self.transcribed_text = transcribed_text
         self.audio_data = audio_data
 
 
+class AudioPendingTextResult(AudioResult):
+    """
+    Result whose transcription has not run yet.
+
+    Returned by batch transcription sources so stopping a recording does not
+    wait for the model; the model invocation worker calls transcribe().
+    """
+
+    __slots__ = ('audio_data', '_transcriber')
+
+    def __init__(self, audio_data: np.ndarray, sample_rate: int,
+                 transcriber: Callable[[np.ndarray], AudioTextResult]):
+        super().__init__("audio_pending_text", sample_rate)
+        self.audio_data = audio_data
+        self._transcriber = transcriber
+
+    def transcribe(self) -> AudioTextResult:
+        """Run the deferred transcription and return its text result."""
+        return self._transcriber(self.audio_data)
+
+
 class AudioChunkHandler(Protocol):
     """Protocol for handling streaming audio chunks."""
 
@@ -48,7 +77,7 @@ class AudioChunkHandler(Protocol):
         Called for each audio chunk during recording.
 
         Args:
-            chunk: Audio data for this chunk
+            chunk: Audio data for this chunk (view of capture storage; do not modify)
             timestamp: Timestamp when chunk was captured
         """
         pass
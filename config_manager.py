@@ -1,13 +1,51 @@
 import os
 import sys
-import argparse
-from dotenv import load_dotenv
 from lib.pr_log import pr_err, pr_notice
 
 
+_SCRIPT_DIR = os.path.dirname(__file__)
+_DOTENV_PATH = os.path.join(_SCRIPT_DIR, '.env')
+_ENV_MODULE_PATH = os.path.join(_SCRIPT_DIR, '.env.py')
+_DEFAULT_TRANSCRIPTION_MODEL = "huggingface/facebook/wav2vec2-lv-60-espeak-cv-ft"
+# Parsed .env contents by path, so later instances skip the file read and parse
+_dotenv_cache = {}
+
+
+def _read_env_module(env_module_path):
+    """Return the ENV dict of a Python env module as strings (compiled once via the pyc cache)."""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("_quickscribe_env", env_module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {key: str(value) for key, value in getattr(module, 'ENV', {}).items()}
+
+
+def _load_dotenv_cached(dotenv_path=_DOTENV_PATH, env_module_path=_ENV_MODULE_PATH):
+    """
+    Apply environment file values without overriding existing variables.
+
+    An optional .env.py defining an ENV dict takes precedence over .env; it is
+    imported rather than parsed, but only Python can read it.
+    """
+    values = _dotenv_cache.get(dotenv_path)
+    if values is None:
+        if os.path.exists(env_module_path):
+            values = _read_env_module(env_module_path)
+        else:
+            from dotenv import dotenv_values
+            values = dotenv_values(dotenv_path)
+        _dotenv_cache[dotenv_path] = values
+    for key, value in values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+
 class ConfigManager:
     """Manages configuration, argument parsing, and interactive model selection for dictation."""
-    
+
+    # Built parsers shared by all instances, keyed by tuple of available modes
+    _parser_cache = {}
+
     def __init__(self):
         self.provider = None
         self.model_id = None
@@ -21,6 +59,7 @@ class ConfigManager:
         self.no_trigger_key = False
         self.xdotool_rate = None
         self.reset_state_each_response = False
+        self.warm_connection = False
 
         # API key configuration
         self.api_key = None
@@ -29,7 +68,7 @@ class ConfigManager:
         self.audio_source = "raw"
 
         # Transcription model configuration
-        self.transcription_model = "huggingface/facebook/wav2vec2-lv-60-espeak-cv-ft"
+        self.transcription_model = _DEFAULT_TRANSCRIPTION_MODEL
         self.transcription_lang = "en"
 
         # Operation mode
@@ -47,32 +86,52 @@ class ConfigManager:
         # Microphone release delay
         self.mic_release_delay = 350  # milliseconds
 
+        # Audio stream buffering (fewer, larger callbacks)
+        self.audio_blocksize = 2048  # frames per callback, 0 = host default
+        self.audio_latency = 'low'
+        self.chunk_batch_ms = 100  # streaming chunk handler batch size
+        self.audio_encoding = 'pcm16'  # WAV sample encoding sent to the model
+
         # Audio validation thresholds
         self.min_recording_duration = 0.7  # seconds
         self.audio_amplitude_threshold = 0.03  # 3% of int16 range
         self.min_peak_duration = 0.5  # seconds (also used as RMS window size)
         self.min_peak_duration_amplitude_threshold = 0.01  # 1% of int16 range for RMS peaks
 
+        # Last parse result, reused while parser and argv are unchanged
+        self._parsed_args = None
+        self._parsed_args_key = None
+
         # Load environment variables
-        script_dir = os.path.dirname(__file__)
-        dotenv_path = os.path.join(script_dir, '.env')
-        load_dotenv(dotenv_path=dotenv_path)
+        _load_dotenv_cached()
     
     def load_models_from_file(self, filename):
         """Loads model names from a text file."""
         try:
-            script_dir = os.path.dirname(__file__)
-            filepath = os.path.join(script_dir, filename)
+            filepath = os.path.join(_SCRIPT_DIR, filename)
             with open(filepath, 'r') as f:
-                models = [line.strip() for line in f if line.strip()]
-            return models
+                lines = f.read().splitlines()
+            return [line for line in map(str.strip, lines) if line]
         except FileNotFoundError:
-            pr_err(f"Model file '{filename}' not found in '{script_dir}'.")
+            pr_err(f"Model file '{filename}' not found in '{_SCRIPT_DIR}'.")
             return []
         except Exception as e:
             pr_err(f"Error reading model file '{filename}': {e}")
             return []
     
+    @staticmethod
+    def _prompt(text):
+        """Read one line from stdin after writing text; raises EOFError at end of input like input()."""
+        if sys.stdin.isatty():
+            # input() gets line editing and history once readline is loaded
+            return input(text)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+
     def select_from_list(self, options, prompt):
         """Prompts user to select an option from a list."""
         if not options:
@@ -82,7 +141,7 @@ class ConfigManager:
             print(f"{i + 1}. {option}")
         while True:
             try:
-                choice = input(f"Enter number (1-{len(options)}): ")
+                choice = self._prompt(f"Enter number (1-{len(options)}): ")
                 index = int(choice) - 1
                 if 0 <= index < len(options):
                     return options[index]
@@ -100,13 +159,18 @@ class ConfigManager:
     
     def setup_argument_parser(self, composer=None):
         """Setup and return the argument parser."""
+        # Get available modes dynamically
+        available_modes = composer.get_available_modes() if composer else ['dictate']
+        key = tuple(available_modes)
+        parser = self._parser_cache.get(key)
+        if parser is not None:
+            return parser
+
+        import argparse
         parser = argparse.ArgumentParser(
             description="Real-time dictation using Groq or Gemini.",
             formatter_class=argparse.ArgumentDefaultsHelpFormatter
         )
-
-        # Get available modes dynamically
-        available_modes = composer.get_available_modes() if composer else ['dictate']
         parser.add_argument(
             "--provider",
             type=str,
@@ -174,6 +238,11 @@ class ConfigManager:
             action="store_true",
             help="Reset XML state after each response (disables persistent state across transcriptions)."
         )
+        parser.add_argument(
+            "--warm-connection",
+            action="store_true",
+            help="With local transcription, send a billable one-token request at startup so the first dictation reuses an open provider connection."
+        )
         parser.add_argument(
             "--xdotool-hz", "--xdotool-cps",
             type=float,
@@ -198,7 +267,7 @@ class ConfigManager:
         parser.add_argument(
             "--transcription-model", "-T",
             type=str,
-            default="huggingface/facebook/wav2vec2-lv-60-espeak-cv-ft",
+            default=_DEFAULT_TRANSCRIPTION_MODEL,
             help="Transcription model specification in format 'provider/model'. Examples: 'huggingface/facebook/wav2vec2-lv-60-espeak-cv-ft', 'openai/whisper-1', 'vosk/path/to/model'."
         )
         parser.add_argument(
@@ -278,10 +347,43 @@ class ConfigManager:
             default=350,
             help="Delay in milliseconds to continue recording after trigger release (default: 350ms)."
         )
+        parser.add_argument(
+            "--audio-blocksize",
+            type=int,
+            default=2048,
+            help="Frames per audio callback (default: 2048 = 128ms at 16kHz, 0 = host default). Larger blocks mean fewer callbacks; streaming transcription caps it at the chunk batch size."
+        )
+        parser.add_argument(
+            "--audio-latency",
+            type=str,
+            choices=['low', 'high'],
+            default='low',
+            help="Audio stream latency hint passed to the host API (default: low)."
+        )
+        parser.add_argument(
+            "--audio-chunk-batch-ms",
+            type=int,
+            default=100,
+            dest="chunk_batch_ms",
+            help="Milliseconds of audio batched per call to streaming transcription handlers (default: 100, 0 = every block)."
+        )
+        parser.add_argument(
+            "--audio-encoding",
+            type=str,
+            choices=['pcm16', 'ulaw'],
+            default='pcm16',
+            help="WAV encoding of audio sent to the model (default: pcm16). 'ulaw' is 8-bit G.711 mu-law: half the upload size; check your model accepts it."
+        )
+
+        self._parser_cache[key] = parser
         return parser
     
     def handle_interactive_mode(self):
         """Handle interactive provider and model selection."""
+        try:
+            import readline  # noqa: F401 - enables line editing for input()
+        except ImportError:
+            pass
         print("Running in interactive mode...")
 
         # Get model ID (require provider/model format)
@@ -291,7 +393,7 @@ class ConfigManager:
         print("  anthropic/claude-3-5-sonnet-20241022")
         print("  gemini/gemini-2.5-flash")
         print("  groq/llama-3.2-90b-vision-preview")
-        self.model_id = input("Model: ").strip()
+        self.model_id = self._prompt("Model: ").strip()
 
         if not self.model_id:
             pr_notice("No model specified. Exiting.")
@@ -309,7 +411,7 @@ class ConfigManager:
         self.sample_rate = args.sample_rate
         self.channels = args.channels
         self.trigger_key_name = args.trigger_key or os.environ.get('QUICKSCRIBE_TRIGGER_KEY', 'alt_r')
-        if getattr(args, "no_trigger_key", False):
+        if args.no_trigger_key:
             self.trigger_key_name = "none"
         
         # Debug: CLI flag takes precedence, then env var
@@ -323,45 +425,64 @@ class ConfigManager:
         
         # Once mode: CLI flag or env var
         env_once = os.environ.get('QUICKSCRIBE_ONCE', '').lower() in ('true', '1', 'yes')
-        self.reset_state_each_response = getattr(args, 'once', False) or env_once
+        self.reset_state_each_response = args.once or env_once
+
+        self.warm_connection = args.warm_connection
 
         # Audio source selection
-        self.audio_source = getattr(args, 'audio_source', 'raw')
+        self.audio_source = args.audio_source
 
         # Operation mode
-        self.mode = getattr(args, 'mode', 'dictate')
-        self.sigusr1_mode = getattr(args, 'sigusr1_mode', 'dictate')
-        self.sigusr2_mode = getattr(args, 'sigusr2_mode', 'shell')
+        self.mode = args.mode
+        self.sigusr1_mode = args.sigusr1_mode
+        self.sigusr2_mode = args.sigusr2_mode
 
         # Transcription model configuration
-        self.transcription_model = getattr(args, 'transcription_model', self.transcription_model)
-        self.transcription_lang = getattr(args, 'transcription_lang', "en")
+        self.transcription_model = args.transcription_model
+        self.transcription_lang = args.transcription_lang
 
         # Provider performance controls (CLI > env > default)
         self.enable_reasoning = args.enable_reasoning or os.environ.get('QUICKSCRIBE_REASONING', 'low')
-        self.thinking_budget = getattr(args, 'thinking_budget', 128)
-        self.temperature = getattr(args, 'temperature', 0.2)
+        self.thinking_budget = args.thinking_budget
+        self.temperature = args.temperature
         env_max_tokens = os.environ.get('QUICKSCRIBE_MAX_TOKENS')
         self.max_tokens = args.max_tokens if args.max_tokens is not None else (int(env_max_tokens) if env_max_tokens else None)
-        self.top_p = getattr(args, 'top_p', 0.9)
+        self.top_p = args.top_p
 
         # API key
-        self.api_key = getattr(args, 'key', None)
+        self.api_key = args.key
 
         # Microphone release delay
-        self.mic_release_delay = getattr(args, 'mic_release_delay', 350)
+        self.mic_release_delay = args.mic_release_delay
+
+        # Audio stream buffering
+        self.audio_blocksize = args.audio_blocksize
+        self.audio_latency = args.audio_latency
+        self.chunk_batch_ms = args.chunk_batch_ms
+        self.audio_encoding = args.audio_encoding
+
+    def _parse_args(self, parser, args_without_script):
+        """Parse command line arguments, reusing the previous namespace for the same parser and argv."""
+        key = (parser, tuple(args_without_script))
+        if self._parsed_args_key != key:
+            self._parsed_args = parser.parse_args(args_without_script)
+            self._parsed_args_key = key
+        return self._parsed_args
 
     def parse_configuration(self):
         """Parse configuration from command line arguments or interactive mode."""
-        # Import here to avoid circular dependency
-        from instruction_composer import InstructionComposer
-
-        composer = InstructionComposer()
-        parser = self.setup_argument_parser(composer)
         args_without_script = sys.argv[1:]
-        args = parser.parse_args()
+        if args_without_script:
+            # Import here to avoid circular dependency
+            from instruction_composer import InstructionComposer
+
+            parser = self.setup_argument_parser(InstructionComposer())
+        else:
+            # No arguments to validate against mode choices; defaults are identical
+            parser = self.setup_argument_parser()
+        args = self._parse_args(parser, args_without_script)
 
-        # Check if model is available from env var
+        # Read the model env var once; both branches below use it
         env_model = os.environ.get('QUICKSCRIBE_MODEL')
         
         if self.is_interactive_mode(args_without_script) and not env_model:
@@ -371,7 +492,7 @@ class ConfigManager:
             self._apply_parsed_args(args)
         else:
             # Non-interactive mode: get model from args or environment
-            self.model_id = args.model or os.environ.get('QUICKSCRIBE_MODEL')
+            self.model_id = args.model or env_model
 
             # Extract provider from model_id (format: "provider/model")
             if self.model_id and '/' in self.model_id:
@@ -385,30 +506,29 @@ class ConfigManager:
 
             # Validate required model
             if not self.model_id:
-                parser.print_help()
                 pr_err("--model is required. Format: provider/model (e.g., gemini/gemini-2.5-flash)")
                 pr_err("Or set QUICKSCRIBE_MODEL environment variable in .env")
+                pr_err("Run with --help for usage.")
                 return False
 
             # Validate model format
             if '/' not in self.model_id:
-                parser.print_help()
                 pr_err(f"Model '{self.model_id}' is malformed. Required format: provider/model (e.g., gemini/gemini-2.5-flash)")
+                pr_err("Run with --help for usage.")
                 return False
 
         # Validate transcription-model flag usage
-        default_transcription_model = self.__class__().transcription_model
-        if self.transcription_model != default_transcription_model:
+        if self.transcription_model != _DEFAULT_TRANSCRIPTION_MODEL:
             if self.audio_source not in ['transcribe', 'trans']:
-                parser.print_help()
                 pr_err(f"--transcription-model requires --audio-source to be 'transcribe' or 'trans', not '{self.audio_source}'")
+                pr_err("Run with --help for usage.")
                 return False
 
         # Validate audio source requirements
         if self.audio_source in ['transcribe', 'trans']:
             if '/' not in self.transcription_model:
-                parser.print_help()
                 pr_err(f"Invalid transcription model format: '{self.transcription_model}'. Expected format: provider/model")
+                pr_err("Run with --help for usage.")
                 return False
 
         return True
@@ -1,7 +1,13 @@
 """
 Main dictation application entry point.
 """
+import os
 import sys
+
+# Configure gRPC before anything imported below can initialize it
+os.environ.setdefault('GRPC_VERBOSITY', 'ERROR')
+os.environ.setdefault('GRPC_ENABLE_FORK_SUPPORT', '0')
+
 from dictation_app import DictationApp
 
 
@@ -12,9 +18,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # Configure gRPC environment variables before any imports
-    import os
-    os.environ['GRPC_VERBOSITY'] = 'ERROR'
-    os.environ['GRPC_ENABLE_FORK_SUPPORT'] = '0'
-
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -218,14 +218,9 @@ class DictationApp:
             if self.input_coordinator.qt_app:
                 pr_debug(f"Starting Qt event loop (qt_app exists, listener={'exists' if listener else 'None'})")
                 self.input_coordinator.qt_app.exec()
-            elif listener:
-                pr_debug("No Qt app, running keyboard listener loop")
-                listener.join()
             else:
-                pr_debug("No Qt app, no listener, running sleep loop")
-                import time
-                while True:
-                    time.sleep(1)
+                pr_debug(f"No Qt app, waiting for exit signal (listener={'exists' if listener else 'None'})")
+                self.input_coordinator.wait_for_exit(listener)
 
         except Exception as e:
             pr_err(f"An unexpected error occurred in main execution: {e}")
@@ -238,8 +233,12 @@ class DictationApp:
     def cleanup(self):
         """Clean up resources."""
         pr_info("Cleaning up...")
+        if self.recording_coordinator:
+            self.recording_coordinator.shutdown()
         if self.processing_coordinator:
             self.processing_coordinator.shutdown()
+        if self.transcription_service and not self.transcription_service.wait_until_typed(timeout=5.0):
+            pr_warn("Keyboard output still being typed at exit; remaining text was dropped")
         if self.input_coordinator:
             self.input_coordinator.cleanup()
         if self.audio_source:
@@ -3,19 +3,16 @@ Input Coordinator - Handles keyboard, POSIX signals, and system tray input.
 """
 import sys
 import signal
+import threading
 from typing import Optional
 from pynput import keyboard
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
 from recording_session import RecordingSource
 from ui import PosixSignalBridge
+from lib.worker_pool import WorkerPool
 from lib.pr_log import pr_err, pr_debug, pr_warn, pr_notice, pr_info
 
 
-class AbortRecording(Exception):
-    """Abort recording due to additional key press during recording."""
-    pass
-
-
 class InputCoordinator:
     """Coordinates input from keyboard, POSIX signals, and system tray."""
 
@@ -25,9 +22,11 @@ class InputCoordinator:
 
         self.trigger_key = None
         self.keyboard_listener = None
+        self.key_events = None
         self.qt_app = None
         self.signal_bridge = None
         self.system_tray = None
+        self.exit_event = threading.Event()
 
     def setup_trigger_key(self):
         """Sets up the trigger key based on configuration."""
@@ -85,6 +84,48 @@ class InputCoordinator:
             traceback.print_exc()
             self.system_tray = None
 
+    def install_signal_handlers(self):
+        """Route POSIX signals to signal channels when no Qt bridge is available."""
+        channels = {
+            'SIGUSR1': "mode_switch_1",
+            'SIGUSR2': "mode_switch_2",
+            'SIGHUP': "stop_recording",
+            'SIGINT': "interrupt",
+        }
+        for signal_name, channel_name in channels.items():
+            signum = getattr(signal, signal_name, None)
+            if signum is None:
+                continue
+
+            # Handlers run on the main thread, which may be parked in
+            # exit_event.wait(); hand the work to a thread instead of
+            # taking locks inside the handler.
+            def handler(_signum, _frame, channel_name=channel_name):
+                threading.Thread(
+                    target=self._handle_signal_channel,
+                    args=(channel_name,),
+                    daemon=True
+                ).start()
+
+            signal.signal(signum, handler)
+        pr_debug("POSIX signal handlers installed")
+
+    def wait_for_exit(self, listener=None):
+        """
+        Block the main thread until exit is requested.
+
+        Exit comes from the interrupt channel (Ctrl+C) or, when a keyboard
+        listener is given, from that listener's thread ending.
+        """
+        self.install_signal_handlers()
+        if listener:
+            def watch_listener():
+                listener.join()
+                self.exit_event.set()
+
+            threading.Thread(target=watch_listener, name="KeyboardListenerWatch", daemon=True).start()
+        self.exit_event.wait()
+
     def start_keyboard_listener(self):
         """Start the keyboard listener if trigger key is configured."""
         if self.trigger_key is None:
@@ -93,9 +134,6 @@ class InputCoordinator:
         def safe_on_press(key):
             try:
                 self.on_press(key)
-            except AbortRecording:
-                self.app.recording_coordinator.abort_recording()
-                self.app._return_to_idle()
             except Exception as e:
                 pr_err(f"Error in on_press: {e}")
 
@@ -105,9 +143,22 @@ class InputCoordinator:
             except Exception as e:
                 pr_err(f"Error in on_release: {e}")
 
+        # Key events are handled on a single worker, in arrival order, so stopping a
+        # recording (release delay, stream close, validation) never stalls the listener
+        self.key_events = WorkerPool(lambda handler, key: handler(key), 1, name="KeyboardInput")
+        self.key_events.start()
+
+        # Only the trigger key's release does anything; other releases are
+        # dropped here rather than queued for every keystroke system-wide
+        trigger_key = self.trigger_key
+
+        def queue_release(key):
+            if key == trigger_key:
+                self.key_events.submit(safe_on_release, key)
+
         self.keyboard_listener = keyboard.Listener(
-            on_press=safe_on_press,
-            on_release=safe_on_release
+            on_press=lambda key: self.key_events.submit(safe_on_press, key),
+            on_release=queue_release
         )
         self.keyboard_listener.start()
         pr_debug("Keyboard listener started")
@@ -130,7 +181,8 @@ class InputCoordinator:
 
         if current_session.should_abort_on_keystroke():
             pr_debug("Non-trigger key pressed during keyboard recording, aborting")
-            raise AbortRecording("Additional key pressed during recording")
+            self.app.recording_coordinator.abort_recording()
+            self.app._return_to_idle()
 
     def on_release(self, key):
         """Handle key release events."""
@@ -149,6 +201,13 @@ class InputCoordinator:
         """Handle signal received via bridge channel."""
         pr_notice(f"Signal channel received: {channel_name}")
 
+        if channel_name == "interrupt":
+            pr_notice("Ctrl+C detected. Exiting.")
+            self.exit_event.set()
+            if self.qt_app:
+                self.qt_app.quit()
+            return
+
         if not self.app.recording_coordinator or not self.app.processing_coordinator:
             pr_warn(f"Signal {channel_name} received before coordinators initialized")
             return
@@ -168,10 +227,6 @@ class InputCoordinator:
 
                 session, result, context = self.app.recording_coordinator.stop_recording()
                 self.app.processing_coordinator.process_recording_result(session, result, context)
-            elif channel_name == "interrupt":
-                pr_notice("Ctrl+C detected. Exiting.")
-                if self.qt_app:
-                    self.qt_app.quit()
         except Exception as e:
             pr_err(f"Error handling signal channel '{channel_name}': {e}")
             import traceback
@@ -199,3 +254,5 @@ class InputCoordinator:
         if self.keyboard_listener and self.keyboard_listener.is_alive():
             pr_debug("Stopping keyboard listener")
             self.keyboard_listener.stop()
+        if self.key_events:
+            self.key_events.shutdown()
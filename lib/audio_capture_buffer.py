@@ -0,0 +1,121 @@
+"""Append-only capture storage for realtime audio, grown off the audio thread."""
+
+import numpy as np
+from typing import Optional
+
+
+class AudioCaptureBuffer:
+    """
+    Append-only store of audio frames in fixed-size, preallocated segments.
+
+    The producer (PortAudio callback thread) copies each block into segments
+    that already exist; it never allocates and never moves stored frames.
+    Another thread calls reserve() to keep spare segments ahead of the write
+    position, so growth costs the producer nothing. A block that does not fit
+    because reserve() fell behind is dropped and counted instead of blocking.
+
+    Stored frames stay in place for the life of the buffer, so ranges may be
+    read with frames() while capture continues. The write index has a single
+    writer and integer rebinding is atomic under the GIL, so no lock is needed.
+    """
+
+    def __init__(self, segment_frames: int, channels: int, dtype, spare_segments: int = 1):
+        """
+        Allocate the first segment and its spares.
+
+        Args:
+            segment_frames: Frames per storage segment
+            channels: Number of interleaved channels per frame
+            dtype: numpy dtype of stored samples
+            spare_segments: Whole segments reserve() keeps free ahead of the producer
+        """
+        if segment_frames <= 0:
+            raise ValueError("segment_frames must be positive")
+
+        self._segment_frames = segment_frames
+        self._channels = channels
+        self._dtype = np.dtype(dtype)
+        self._spare_frames = spare_segments * segment_frames
+        self._segments = []
+        self._write_idx = 0
+        self.dropped_blocks = 0
+        self.dropped_frames = 0
+        self.reserve()
+
+    @property
+    def capacity(self) -> int:
+        """Frames that fit in the segments allocated so far."""
+        return len(self._segments) * self._segment_frames
+
+    @property
+    def segment_frames(self) -> int:
+        """Frames per storage segment."""
+        return self._segment_frames
+
+    @property
+    def frames_written(self) -> int:
+        """Number of frames stored."""
+        return self._write_idx
+
+    def reserve(self) -> None:
+        """Add segments until the spare space ahead of the producer is covered (never call on the producer thread)."""
+        while self.capacity - self._write_idx <= self._spare_frames:
+            segment = np.empty((self._segment_frames, self._channels), dtype=self._dtype)
+            # Touch every page here so the producer takes no first-write page faults
+            segment.fill(0)
+            # Appending publishes the segment; the producer only indexes existing ones
+            self._segments.append(segment)
+
+    def write(self, block: np.ndarray) -> bool:
+        """
+        Copy a block of frames into storage (producer side).
+
+        The source block is not retained, so callers may pass buffers that are
+        reused after return (such as PortAudio's indata).
+
+        Args:
+            block: Array of shape (frames, channels)
+
+        Returns:
+            False if the block was dropped for lack of reserved space
+        """
+        frames = len(block)
+        write_idx = self._write_idx
+        if write_idx + frames > len(self._segments) * self._segment_frames:
+            self.dropped_blocks += 1
+            self.dropped_frames += frames
+            return False
+
+        copied = 0
+        while copied < frames:
+            segment, offset = divmod(write_idx + copied, self._segment_frames)
+            count = min(frames - copied, self._segment_frames - offset)
+            np.copyto(self._segments[segment][offset:offset + count], block[copied:copied + count])
+            copied += count
+
+        # Publish only after the data is in place
+        self._write_idx = write_idx + frames
+        return True
+
+    def frames(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """
+        Stored frames in [start, end), end defaulting to everything written.
+
+        Returns:
+            Array of shape (frames, channels); a view into storage when the
+            range lies in one segment, otherwise a single contiguous copy
+        """
+        if end is None:
+            end = self._write_idx
+        if start >= end:
+            return np.empty((0, self._channels), dtype=self._dtype)
+
+        first, first_offset = divmod(start, self._segment_frames)
+        last, last_offset = divmod(end - 1, self._segment_frames)
+        if first == last:
+            return self._segments[first][first_offset:last_offset + 1]
+
+        pieces = [self._segments[first][first_offset:]]
+        pieces.extend(self._segments[first + 1:last])
+        pieces.append(self._segments[last][:last_offset + 1])
+        return np.concatenate(pieces)
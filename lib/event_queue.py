@@ -1,7 +1,7 @@
 """Generic event-driven queue processor for sequential task execution."""
 
-import queue
 import threading
+from collections import deque
 from typing import Callable, Any, Optional
 from lib.pr_log import pr_debug, pr_warn
 
@@ -11,7 +11,9 @@ class EventQueue:
     Thread-safe event-driven queue processor.
 
     Processes queued items sequentially in a dedicated worker thread.
-    Uses event-based signaling to avoid polling.
+    Uses event-based signaling to avoid polling. Items are held in a deque,
+    whose append/popleft are atomic, so the wake event is the only
+    synchronization needed.
     """
 
     def __init__(self, processor_callback: Callable[[Any], None], name: str = "EventQueue"):
@@ -29,7 +31,7 @@ class EventQueue:
 
         self._processor = processor_callback
         self._name = name
-        self._queue = queue.Queue()
+        self._queue = deque()
         self._wake_event = threading.Event()
         self._shutdown_event = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
@@ -56,9 +58,9 @@ class EventQueue:
         Args:
             item: Item to be processed by callback
         """
-        self._queue.put(item)
+        self._queue.append(item)
         self._wake_event.set()
-        pr_debug(f"{self._name}: Item enqueued, queue size={self._queue.qsize()}")
+        pr_debug(f"{self._name}: Item enqueued, queue size={len(self._queue)}")
 
     def shutdown(self, timeout: float = 2.0) -> None:
         """
@@ -98,22 +100,20 @@ class EventQueue:
             if self._shutdown_event.is_set():
                 break
 
-            while not self._queue.empty():
+            # Clear before draining so an enqueue during the drain re-arms the wake
+            self._wake_event.clear()
+
+            while self._queue:
                 if self._shutdown_event.is_set():
                     break
 
+                item = self._queue.popleft()
                 try:
-                    item = self._queue.get_nowait()
                     pr_debug(f"{self._name}: Processing item")
                     self._processor(item)
-                    self._queue.task_done()
-                except queue.Empty:
-                    break
                 except Exception as e:
                     pr_warn(f"{self._name}: Error processing item: {e}")
                     import traceback
                     traceback.print_exc()
 
-            self._wake_event.clear()
-
         pr_debug(f"{self._name}: Worker loop exited")
@@ -93,37 +93,32 @@ class WindowsKeyboardInjector(KeyboardInjector):
         if result != 1:
             raise RuntimeError(f"SendInput failed with result: {result}")
 
+    def _send_inputs(self, inputs: list) -> None:
+        """Send several INPUT records with a single SendInput call."""
+        count = len(inputs)
+        array = (INPUT * count)(*inputs)
+        result = user32.SendInput(count, array, ctypes.sizeof(INPUT))
+        if result != count:
+            raise RuntimeError(f"SendInput sent {result} of {count} inputs")
+
     def _send_unicode(self, char: str) -> None:
-        """Send a Unicode character using SendInput."""
+        """Send Unicode characters as one batch of key down/up events."""
         extra = ctypes.pointer(wintypes.ULONG(0))
+        inputs = []
         for c in char:
             code_point = ord(c)
-
-            ki_down = KEYBDINPUT(
-                wVk=0,
-                wScan=code_point,
-                dwFlags=KEYEVENTF_UNICODE,
-                time=0,
-                dwExtraInfo=extra
-            )
-            inp_down = INPUT(type=INPUT_KEYBOARD, ki=ki_down)
-
-            ki_up = KEYBDINPUT(
-                wVk=0,
-                wScan=code_point,
-                dwFlags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP,
-                time=0,
-                dwExtraInfo=extra
-            )
-            inp_up = INPUT(type=INPUT_KEYBOARD, ki=ki_up)
-
-            result = user32.SendInput(1, ctypes.byref(inp_down), ctypes.sizeof(inp_down))
-            if result != 1:
-                raise RuntimeError(f"SendInput failed for key down: {result}")
-
-            result = user32.SendInput(1, ctypes.byref(inp_up), ctypes.sizeof(inp_up))
-            if result != 1:
-                raise RuntimeError(f"SendInput failed for key up: {result}")
+            for flags in (KEYEVENTF_UNICODE, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP):
+                ki = KEYBDINPUT(
+                    wVk=0,
+                    wScan=code_point,
+                    dwFlags=flags,
+                    time=0,
+                    dwExtraInfo=extra
+                )
+                inputs.append(INPUT(type=INPUT_KEYBOARD, ki=ki))
+
+        if inputs:
+            self._send_inputs(inputs)
 
     def bksp(self, count: int) -> None:
         """Backspace count characters using SendInput."""
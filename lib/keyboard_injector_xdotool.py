@@ -5,6 +5,7 @@ import os
 import sys
 import time
 import threading
+from typing import Optional, Tuple
 sys.path.append(os.path.join(os.path.dirname(__file__), 'xml-stream'))
 from keyboard_injector import KeyboardInjector
 sys.path.insert(0, os.path.dirname(__file__))
@@ -15,6 +16,18 @@ from pynput import keyboard
 class ModifierStateTracker:
     """Tracks modifier key states using pynput keyboard listener."""
 
+    # Modifier name for each pynput key, resolved once instead of per key event
+    _MODIFIER_KEYS = {
+        key: name
+        for name, keys in (
+            ('ctrl', (keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r)),
+            ('alt', (keyboard.Key.alt, keyboard.Key.alt_l, keyboard.Key.alt_r)),
+            ('shift', (keyboard.Key.shift, keyboard.Key.shift_l, keyboard.Key.shift_r)),
+            ('super', (keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r)),
+        )
+        for key in keys
+    }
+
     def __init__(self):
         self._modifiers = {
             'ctrl': False,
@@ -33,30 +46,21 @@ class ModifierStateTracker:
         self._listener.start()
 
     def _on_press(self, key):
+        name = self._MODIFIER_KEYS.get(key)
+        if name is None:
+            return
+
         with self._lock:
-            if key in (keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                self._modifiers['ctrl'] = True
-            elif key in (keyboard.Key.alt, keyboard.Key.alt_l, keyboard.Key.alt_r):
-                self._modifiers['alt'] = True
-            elif key in (keyboard.Key.shift, keyboard.Key.shift_l, keyboard.Key.shift_r):
-                self._modifiers['shift'] = True
-            elif key in (keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r):
-                self._modifiers['super'] = True
-
-            if any(self._modifiers.values()):
-                self._no_modifiers_event.clear()
+            self._modifiers[name] = True
+            self._no_modifiers_event.clear()
 
     def _on_release(self, key):
-        with self._lock:
-            if key in (keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                self._modifiers['ctrl'] = False
-            elif key in (keyboard.Key.alt, keyboard.Key.alt_l, keyboard.Key.alt_r):
-                self._modifiers['alt'] = False
-            elif key in (keyboard.Key.shift, keyboard.Key.shift_l, keyboard.Key.shift_r):
-                self._modifiers['shift'] = False
-            elif key in (keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r):
-                self._modifiers['super'] = False
+        name = self._MODIFIER_KEYS.get(key)
+        if name is None:
+            return
 
+        with self._lock:
+            self._modifiers[name] = False
             if not any(self._modifiers.values()):
                 self._no_modifiers_event.set()
 
@@ -101,6 +105,14 @@ class XdotoolKeyboardInjector(KeyboardInjector):
             any("pytest" in arg for arg in sys.argv if arg)
         )
         self._modifier_tracker = ModifierStateTracker()
+        # Operations since the last flush: backspaces first, then text
+        self._pending_backspaces = 0
+        self._pending_text = ""
+        # Flushed operations not yet taken by the typing thread, merged into one slot
+        self._outbox = (0, "")
+        self._outbox_cond = threading.Condition()
+        self._typing = False
+        self._typer: Optional[threading.Thread] = None
 
     def _run_xdotool(self, cmd: list) -> None:
         """Execute xdotool command after waiting for modifier keys to be released."""
@@ -109,42 +121,113 @@ class XdotoolKeyboardInjector(KeyboardInjector):
         try:
             if self.debug_enabled:
                 pr_debug(f"xdotool command: {' '.join(cmd)}")
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            # stdout is never read; stderr is kept raw and only decoded on failure
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except subprocess.CalledProcessError as e:
+            detail = e.stderr.decode(errors='replace').strip() if e.stderr else ""
+            pr_err(f"xdotool command failed: {str(e)}" + (f": {detail}" if detail else ""))
+        except FileNotFoundError as e:
             pr_err(f"xdotool command failed: {str(e)}")
 
+    @staticmethod
+    def _merge(backspaces: int, text: str, more_backspaces: int, more_text: str) -> Tuple[int, str]:
+        """
+        Combine (backspaces, then text) with further (backspaces, then text).
+
+        Deleting text that has not been typed yet just drops it; anything left
+        deletes past that text, which is then empty.
+        """
+        cancelled = min(more_backspaces, len(text))
+        if cancelled:
+            text = text[:-cancelled]
+        return backspaces + more_backspaces - cancelled, text + more_text
+
     def bksp(self, count: int) -> None:
-        """Backspace count characters."""
+        """Backspace count characters (buffered until flush)."""
         if self.test_mode or count <= 0:
             return
 
-        cmd = [
-            "xdotool", "key",
-            "--delay", str(self.typing_delay),
-            "--repeat", str(count),
-            "BackSpace"
-        ]
-        self._run_xdotool(cmd)
-    
+        self._pending_backspaces, self._pending_text = self._merge(
+            self._pending_backspaces, self._pending_text, count, "")
+
     def emit(self, text: str) -> None:
-        """Emit text at current cursor position."""
+        """Emit text at current cursor position (buffered until flush)."""
         if self.test_mode or not text:
             return
 
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            if line:
-                cmd = [
-                    "xdotool", "type",
-                    "--delay", str(self.typing_delay),
-                    "--",
-                    line
-                ]
-                self._run_xdotool(cmd)
-
-            if i < len(lines) - 1:
-                cmd = ["xdotool", "key", "Return"]
-                self._run_xdotool(cmd)
+        self._pending_text += text
+
+    def flush(self) -> None:
+        """
+        Hand buffered operations to the typing thread.
+
+        xdotool runs take tens of milliseconds, so they happen off the
+        caller's thread. Updates flushed while a run is in progress are
+        merged and sent together by the next one.
+        """
+        backspaces, text = self._pending_backspaces, self._pending_text
+        if not backspaces and not text:
+            return
+        self._pending_backspaces, self._pending_text = 0, ""
+
+        with self._outbox_cond:
+            self._outbox = self._merge(*self._outbox, backspaces, text)
+            if self._typer is None:
+                self._typer = threading.Thread(target=self._typer_loop, name="XdotoolTyper", daemon=True)
+                self._typer.start()
+            self._outbox_cond.notify_all()
+
+    def wait_until_typed(self, timeout: Optional[float] = None) -> bool:
+        """Block until every flushed operation has been sent; False on timeout."""
+        with self._outbox_cond:
+            return self._outbox_cond.wait_for(
+                lambda: self._outbox == (0, "") and not self._typing, timeout)
+
+    def _typer_loop(self) -> None:
+        """Typing thread: send whatever has accumulated in the outbox."""
+        while True:
+            with self._outbox_cond:
+                self._outbox_cond.wait_for(lambda: self._outbox != (0, ""))
+                backspaces, text = self._outbox
+                self._outbox = (0, "")
+                self._typing = True
+            try:
+                self._type(backspaces, text)
+            except Exception as e:
+                pr_err(f"xdotool typing failed: {e}")
+            finally:
+                with self._outbox_cond:
+                    self._typing = False
+                    self._outbox_cond.notify_all()
+
+    def _type(self, backspaces: int, text: str) -> None:
+        """
+        Send backspaces and text with as few xdotool processes as possible.
+
+        xdotool chains commands in one invocation, but `type` consumes the
+        rest of the arguments, so each typed line ends an invocation.
+        """
+        cmd = ["xdotool"]
+        if backspaces:
+            cmd += [
+                "key",
+                "--delay", str(self.typing_delay),
+                "--repeat", str(backspaces),
+                "BackSpace"
+            ]
+
+        if text:
+            lines = text.split('\n')
+            for i, line in enumerate(lines):
+                if i > 0:
+                    cmd += ["key", "Return"]
+                if line:
+                    cmd += ["type", "--delay", str(self.typing_delay), "--", line]
+                    self._run_xdotool(cmd)
+                    cmd = ["xdotool"]
+
+        if len(cmd) > 1:
+            self._run_xdotool(cmd)
 
     def __del__(self):
         """Cleanup modifier tracker on destruction."""
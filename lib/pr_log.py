@@ -11,6 +11,7 @@ Streaming output properly cleans up when context exits or object goes out of sco
 from colorama import Fore, Style, init
 import sys
 import threading
+import time
 from collections import deque
 from typing import Dict
 
@@ -156,11 +157,17 @@ class StreamingOutputHandler:
             stream.write("streaming content")
             pr_info("this will queue")
             pr_err("this displays immediately")
+
+    With a positive flush_interval, write() collects text and prints it at
+    most once per interval (and on cleanup) instead of once per call.
     """
 
-    def __init__(self):
+    def __init__(self, flush_interval: float = 0.0):
         self._active = False
         self._last_full_text = ""
+        self._flush_interval = flush_interval
+        self._pending = []
+        self._last_flush = time.monotonic()
 
     def __enter__(self):
         global _streaming_active
@@ -197,6 +204,8 @@ class StreamingOutputHandler:
             _streaming_active = False
             self._active = False
 
+        self._flush_pending()
+
         # Trailing newline after streaming ends (single point of truth)
         print(flush=True)
 
@@ -204,24 +213,55 @@ class StreamingOutputHandler:
             _flush_queue()
 
     def _common_prefix_length(self, old: str, new: str) -> int:
-        """Calculate length of common prefix between two strings."""
-        for i, (c1, c2) in enumerate(zip(old, new)):
-            if c1 != c2:
-                return i
-        return min(len(old), len(new))
+        """
+        Calculate length of common prefix between two strings.
+
+        Compares slices (C memcmp) instead of single characters: one check
+        covers the usual pure-append update, and otherwise a binary search
+        narrows down the first difference.
+        """
+        limit = min(len(old), len(new))
+        if old[:limit] == new[:limit]:
+            return limit
+
+        # old[:low] matches, old[:high] does not
+        low, high = 0, limit
+        while high - low > 1:
+            mid = (low + high) // 2
+            if old[low:mid] == new[low:mid]:
+                low = mid
+            else:
+                high = mid
+        return low
+
+    def _flush_pending(self):
+        """Print text collected by buffered write() calls."""
+        if self._pending:
+            text = ''.join(self._pending)
+            self._pending.clear()
+            print(f"{Fore.WHITE}{text}{Style.RESET_ALL}", end='', flush=True)
+        self._last_flush = time.monotonic()
 
     def write(self, text: str):
         """Write streaming content without newline (standard white color)."""
         if not text:
             return
 
-        print(f"{Fore.WHITE}{text}{Style.RESET_ALL}", end='', flush=True)
+        if self._flush_interval <= 0:
+            print(f"{Fore.WHITE}{text}{Style.RESET_ALL}", end='', flush=True)
+            return
+
+        self._pending.append(text)
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self._flush_pending()
 
     def write_full(self, text: str):
         """Write full text update, backspacing to common prefix."""
         if not text:
             return
 
+        self._flush_pending()
+
         prefix_len = self._common_prefix_length(self._last_full_text, text)
         backspace_count = len(self._last_full_text) - prefix_len
         new_suffix = text[prefix_len:]
@@ -291,11 +331,14 @@ def set_log_level(level: int):
         _current_log_level = level
 
 
-def get_streaming_handler() -> StreamingOutputHandler:
+def get_streaming_handler(flush_interval: float = 0.0) -> StreamingOutputHandler:
     """
     Get streaming output handler context manager.
 
+    Args:
+        flush_interval: Minimum seconds between prints of write() text (0 = every call)
+
     Returns:
         StreamingOutputHandler instance for use with 'with' statement
     """
-    return StreamingOutputHandler()
+    return StreamingOutputHandler(flush_interval)
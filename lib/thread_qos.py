@@ -0,0 +1,51 @@
+"""Scheduling hints for application threads."""
+
+import ctypes
+import ctypes.util
+import os
+import sys
+from lib.pr_log import pr_debug
+
+# macOS qos_class_t values from <sys/qos.h>
+QOS_CLASS_USER_INITIATED = 0x19
+QOS_CLASS_UTILITY = 0x11
+
+_libc = None
+
+
+def _set_darwin_qos(qos_class: int) -> None:
+    """Set the QoS class of the calling thread on macOS."""
+    global _libc
+    try:
+        if _libc is None:
+            _libc = ctypes.CDLL(ctypes.util.find_library('c'))
+        result = _libc.pthread_set_qos_class_self_np(qos_class, 0)
+    except (OSError, AttributeError) as e:
+        pr_debug(f"Thread QoS unavailable: {e}")
+        return
+    if result != 0:
+        pr_debug(f"Thread QoS not applied: {os.strerror(result)}")
+
+
+def set_interactive_qos() -> None:
+    """
+    Mark the calling thread as doing work the user is waiting on.
+
+    macOS schedules it ahead of default and background threads. Linux
+    offers no unprivileged way to raise a thread, so it stays at normal
+    priority there.
+    """
+    if sys.platform == 'darwin':
+        _set_darwin_qos(QOS_CLASS_USER_INITIATED)
+
+
+def set_background_qos() -> None:
+    """Let the calling thread yield to interactive and audio threads."""
+    if sys.platform == 'darwin':
+        _set_darwin_qos(QOS_CLASS_UTILITY)
+    elif hasattr(os, 'SCHED_BATCH'):
+        try:
+            # pid 0 targets the calling thread on Linux
+            os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+        except OSError as e:
+            pr_debug(f"Thread background scheduling unavailable: {e}")
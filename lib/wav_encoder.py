@@ -0,0 +1,142 @@
+"""In-memory WAV encoding for int16 PCM audio (optionally as 8-bit mu-law)."""
+
+import struct
+import threading
+import numpy as np
+
+_PCM_FORMAT = 1
+_MULAW_FORMAT = 7
+_BYTES_PER_SAMPLE = 2
+# Compiled once; pack/pack_into reuse the parsed format on every encode
+_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+WAV_HEADER_SIZE = _HEADER.size
+
+# Non-PCM WAV header: fmt chunk with cbSize plus the fact chunk (frame count)
+_MULAW_HEADER = struct.Struct('<4sI4s4sIHHIIHHH4sII4sI')
+
+# G.711 mu-law on 14-bit magnitudes (as in the Sun reference coder and audioop)
+_MULAW_SEGMENT_ENDS = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32)
+_MULAW_CLIP = 8159
+_MULAW_BIAS = 0x21
+
+# Per-thread scratch buffer reused by encode_pcm16_wav_view
+_scratch = threading.local()
+
+
+def _header_fields(num_frames: int, sample_rate: int, channels: int) -> tuple:
+    """Values for _HEADER describing num_frames of 16-bit PCM."""
+    block_align = channels * _BYTES_PER_SAMPLE
+    data_size = num_frames * block_align
+    return (
+        b'RIFF', WAV_HEADER_SIZE - 8 + data_size, b'WAVE',
+        b'fmt ', 16, _PCM_FORMAT, channels, sample_rate,
+        sample_rate * block_align, block_align, _BYTES_PER_SAMPLE * 8,
+        b'data', data_size,
+    )
+
+
+def wav_header(num_frames: int, sample_rate: int, channels: int) -> bytes:
+    """
+    Build the canonical 44-byte RIFF/WAVE header for 16-bit PCM.
+
+    Args:
+        num_frames: Number of sample frames that follow the header
+        sample_rate: Samples per second
+        channels: Interleaved channels per frame
+
+    Returns:
+        Header bytes
+    """
+    return _HEADER.pack(*_header_fields(num_frames, sample_rate, channels))
+
+
+def encode_pcm16_wav(audio: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode int16 audio as a PCM_16 WAV file without libsndfile.
+
+    Args:
+        audio: int16 samples, shape (frames,) or (frames, channels)
+        sample_rate: Samples per second
+
+    Returns:
+        Complete WAV file bytes
+    """
+    if audio.dtype != np.int16:
+        raise TypeError(f"expected int16 audio, got {audio.dtype}")
+    # No-op for captured audio (already C-contiguous little-endian int16)
+    audio = np.ascontiguousarray(audio, dtype='<i2')
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    return wav_header(len(audio), sample_rate, channels) + audio.tobytes()
+
+
+def encode_pcm16_wav_view(audio: np.ndarray, sample_rate: int) -> memoryview:
+    """
+    Encode int16 audio as a PCM_16 WAV file into a reused per-thread buffer.
+
+    Header and samples are written in place, so repeated encodes on one
+    thread allocate only when a recording is longer than any before it.
+
+    Args:
+        audio: int16 samples, shape (frames,) or (frames, channels)
+        sample_rate: Samples per second
+
+    Returns:
+        View of the WAV bytes, valid until the next call on this thread
+    """
+    if audio.dtype != np.int16:
+        raise TypeError(f"expected int16 audio, got {audio.dtype}")
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    size = WAV_HEADER_SIZE + audio.size * _BYTES_PER_SAMPLE
+
+    buffer = getattr(_scratch, 'buffer', None)
+    if buffer is None or len(buffer) < size:
+        # Replace rather than resize: earlier views may still be referenced
+        buffer = bytearray(size)
+        _scratch.buffer = buffer
+
+    _HEADER.pack_into(buffer, 0, *_header_fields(len(audio), sample_rate, channels))
+    samples = np.frombuffer(buffer, dtype='<i2', count=audio.size, offset=WAV_HEADER_SIZE)
+    samples.reshape(audio.shape)[...] = audio
+    return memoryview(buffer)[:size]
+
+
+def encode_mulaw_wav(audio: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode int16 audio as an 8-bit G.711 mu-law WAV file.
+
+    Half the size of PCM_16 for the same audio, at telephone-grade
+    companding that speech recognition tolerates well.
+
+    Args:
+        audio: int16 samples, shape (frames,) or (frames, channels)
+        sample_rate: Samples per second
+
+    Returns:
+        Complete WAV file bytes
+    """
+    if audio.dtype != np.int16:
+        raise TypeError(f"expected int16 audio, got {audio.dtype}")
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    num_frames = len(audio)
+    data_size = audio.size
+    # RIFF chunks are word-aligned: an odd-sized data chunk is followed by a
+    # pad byte that the RIFF size counts and the data chunk size does not
+    pad = data_size & 1
+
+    samples = audio.astype(np.int32).ravel() >> 2
+    mask = np.where(samples < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(samples), _MULAW_CLIP) + _MULAW_BIAS
+    segment = np.searchsorted(_MULAW_SEGMENT_ENDS, magnitude)
+    mantissa = (magnitude >> np.minimum(segment + 1, 8)) & 0x0F
+    # Magnitudes past the last segment saturate
+    code = np.where(segment >= 8, 0x7F, (segment << 4) | mantissa)
+    encoded = (code ^ mask).astype(np.uint8)
+
+    header = _MULAW_HEADER.pack(
+        b'RIFF', _MULAW_HEADER.size - 8 + data_size + pad, b'WAVE',
+        b'fmt ', 18, _MULAW_FORMAT, channels, sample_rate,
+        sample_rate * channels, channels, 8, 0,
+        b'fact', 4, num_frames,
+        b'data', data_size,
+    )
+    return header + encoded.tobytes() + (b'\x00' if pad else b'')
@@ -0,0 +1,106 @@
+"""Persistent worker threads for parallel task execution."""
+
+import queue
+import threading
+from typing import Callable, Any, List, Optional
+from lib.pr_log import pr_debug, pr_warn
+
+
+class WorkerPool:
+    """
+    Fixed set of long-lived daemon worker threads sharing one inbox.
+
+    Counterpart to EventQueue for work that may run concurrently: items are
+    handed to whichever worker is idle instead of spawning a thread per item.
+    The inbox is a queue.SimpleQueue, whose put/get are implemented in C
+    without the Condition machinery of queue.Queue.
+    """
+
+    _SHUTDOWN = object()
+
+    def __init__(self, processor_callback: Callable[..., None], size: int, name: str = "WorkerPool",
+                 initializer: Optional[Callable[[], None]] = None):
+        """
+        Initialize worker pool.
+
+        Args:
+            processor_callback: Function called with the arguments of each submit()
+            size: Number of worker threads
+            name: Descriptive name for logging and thread names
+            initializer: Optional function each worker calls once before taking items
+        """
+        if not callable(processor_callback):
+            raise TypeError("processor_callback must be callable")
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self._processor = processor_callback
+        self._size = size
+        self._name = name
+        self._initializer = initializer
+        self._inbox: queue.SimpleQueue = queue.SimpleQueue()
+        self._workers: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self.is_running():
+            pr_warn(f"{self._name}: Workers already running")
+            return
+
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"{self._name}-{i}", daemon=True)
+            for i in range(self._size)
+        ]
+        for worker in self._workers:
+            worker.start()
+        pr_debug(f"{self._name}: {self._size} workers started")
+
+    def submit(self, *args: Any) -> None:
+        """
+        Queue a call of the processor with the given arguments.
+
+        Args:
+            *args: Positional arguments for processor_callback
+        """
+        self._inbox.put(args)
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """
+        Stop workers after items already submitted.
+
+        Args:
+            timeout: Maximum seconds to wait for each worker to finish
+        """
+        if not self.is_running():
+            return
+
+        for _ in self._workers:
+            self._inbox.put(self._SHUTDOWN)
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+            if worker.is_alive():
+                pr_warn(f"{self._name}: {worker.name} did not terminate within {timeout}s")
+
+    def is_running(self) -> bool:
+        """Check if any worker thread is active."""
+        return any(worker.is_alive() for worker in self._workers)
+
+    def _worker_loop(self) -> None:
+        """Worker thread main loop - blocks on the shared inbox."""
+        if self._initializer is not None:
+            try:
+                self._initializer()
+            except Exception as e:
+                pr_warn(f"{self._name}: Worker initializer failed: {e}")
+
+        while True:
+            args = self._inbox.get()
+            if args is self._SHUTDOWN:
+                break
+
+            try:
+                self._processor(*args)
+            except Exception as e:
+                pr_warn(f"{self._name}: Error processing item: {e}")
+                import traceback
+                traceback.print_exc()
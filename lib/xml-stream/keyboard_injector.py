@@ -1,6 +1,7 @@
 """Keyboard injector interface for XML stream processor."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class KeyboardInjector(ABC):
@@ -16,6 +17,14 @@ class KeyboardInjector(ABC):
         """Emit text at current cursor position."""
         pass
 
+    def flush(self) -> None:
+        """Deliver operations buffered by bksp()/emit(); called after each batch of updates."""
+        pass
+
+    def wait_until_typed(self, timeout: Optional[float] = None) -> bool:
+        """Block until flushed operations have reached the keyboard; False on timeout."""
+        return True
+
 
 class MockKeyboardInjector(KeyboardInjector):
     """Mock keyboard injector for testing."""
@@ -366,3 +366,44 @@ class TestXMLStreamProcessor:
         ]
         assert self.keyboard.operations == expected_operations
         assert self.keyboard.output == "Hi "
+
+    def test_inserted_sequence_between_existing_words(self):
+        """Test a new sequence number inserted between existing words keeps order."""
+        initial_words = {10: "The ", 30: "fox "}
+        self.processor.reset(initial_words)
+
+        self.processor.process_chunk("<20>quick </20>")
+        self.processor.process_chunk("<40>jumps </40>")
+        self.processor.end_stream()
+
+        expected_operations = [
+            ('bksp', 4),  # len("The fox ") - len("The ")
+            ('emit', "quick "),
+            ('emit', "fox "),  # Gap fill up to 40
+            ('emit', "jumps ")
+        ]
+        assert self.keyboard.operations == expected_operations
+        assert self.processor._build_string_from_words(self.processor.current_words) == "The quick fox jumps "
+
+    def test_debug_trace_bounded_and_kept_for_error_dump(self):
+        """Streaming keeps only the most recent trace messages, even with debug output off."""
+        self.processor.start_stream()
+        self.processor.reset({10: "Hello "})
+        self.processor.process_chunk("<10>Hi </10><20>there </20>")
+
+        # Available for the dump on the error path
+        assert self.processor.debug_buffer
+
+        for i in range(3000):
+            self.processor._debug(f"message {i}")
+        assert len(self.processor.debug_buffer) == self.processor.debug_buffer.maxlen
+        assert self.processor.debug_buffer[-1] == "message 2999"
+
+    def test_short_words_are_shared_across_updates(self):
+        """Repeated short words resolve to one string object; long ones are kept as parsed."""
+        long_word = "internationalization "
+        first, _ = self.processor._extract_complete_tags(f"<10>the </10><20>{long_word}</20>")
+        second, _ = self.processor._extract_complete_tags(f"<10>the </10><20>{long_word}</20>")
+
+        assert first[0][1] is second[0][1]
+        assert first[1][1] == second[1][1] == long_word
@@ -1,14 +1,26 @@
 """XML Stream Sequential Word Processing Implementation."""
 
+import bisect
+import collections
 import re
 import sys
 import os
-from typing import Dict, List, Tuple
+from typing import Deque, Dict, List, Tuple
 
 from keyboard_injector import KeyboardInjector
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__))))
 from pr_log import pr_warn, pr_debug
 
+# Complete <N>word</N> tag; compiled once since it runs on every streamed chunk
+_TAG_RE = re.compile(r'<(\d+)>(.*?)</(\d+)>')
+
+# Words up to this length are interned: updates resend unchanged words, so
+# comparing them against current_words becomes an identity check
+_INTERN_MAX_LEN = 16
+
+# Most recent trace messages kept while streaming, for the dump on error or end of stream
+_DEBUG_TRACE_LINES = 1000
+
 
 class XMLStreamProcessor:
     """Processes XML-tagged word updates arriving in sequential order."""
@@ -16,18 +28,23 @@ class XMLStreamProcessor:
     def __init__(self, keyboard: KeyboardInjector, debug_enabled: bool = False):
         self.keyboard = keyboard
         self.current_words: Dict[int, str] = {}
+        # Incremented whenever current_words is mutated, so readers can cache derived strings
+        self.version: int = 0
+        # (words dict, its keys in ascending order), kept sorted by insertion
+        self._seq_cache: Tuple[Dict[int, str], List[int]] = ({}, [])
         self.xml_buffer: str = ""
         self.backspace_performed: bool = False
         self.last_emitted_seq: int = 0
 
         # Debug system
         self.debug_enabled = debug_enabled
-        self.debug_buffer: List[str] = []
+        self.debug_buffer: Deque[str] = collections.deque(maxlen=_DEBUG_TRACE_LINES)
         self.streaming_active: bool = False
     
     def reset(self, words: Dict[int, str]) -> None:
         """Initialize with new word mapping for new transcription session."""
         self.current_words = words.copy()
+        self.version += 1
         self.xml_buffer = ""
         self.backspace_performed = False
         self.last_emitted_seq = 0
@@ -42,6 +59,7 @@ class XMLStreamProcessor:
         # Process each update
         for seq, word in updates:
             self._process_single_update(seq, word)
+        self.keyboard.flush()
 
     def end_stream(self) -> None:
         """Flush remaining chunks from last_emitted_seq to end."""
@@ -52,6 +70,7 @@ class XMLStreamProcessor:
                 word = self.current_words[max_seq]
                 if word and not word.endswith(' '):
                     self.current_words[max_seq] = word + ' '
+                    self.version += 1
 
                     # If already emitted, emit just the space
                     if max_seq <= self.last_emitted_seq:
@@ -62,6 +81,7 @@ class XMLStreamProcessor:
             max_seq = max(self.current_words.keys()) if self.current_words else 0
             if max_seq > self.last_emitted_seq:
                 self._emit_up_to_sequence(max_seq)
+        self.keyboard.flush()
 
         # Mark end of streaming and flush debug if enabled
         self.streaming_active = False
@@ -75,7 +95,7 @@ class XMLStreamProcessor:
         """Buffer debug messages during streaming, show immediately if not streaming."""
         if self.streaming_active:
             self.debug_buffer.append(message)
-        elif self.debug_enabled:
+        else:
             pr_debug(message)
 
     def _flush_debug_buffer(self) -> None:
@@ -101,13 +121,15 @@ class XMLStreamProcessor:
 
     def _extract_complete_tags(self, buffer: str) -> Tuple[List[Tuple[int, str]], str]:
         """Extract complete <N>word</N> tags, return remaining buffer."""
-        pattern = r'<(\d+)>(.*?)</(\d+)>'
         updates = []
         last_end = 0
+        # Trace messages are only ever shown with debug enabled; skip formatting them otherwise
+        debug = self.debug_enabled
 
-        self._debug(f"      _extract_complete_tags(buffer='{buffer}')")
+        if debug:
+            self._debug(f"      _extract_complete_tags(buffer='{buffer}')")
 
-        for match in re.finditer(pattern, buffer):
+        for match in _TAG_RE.finditer(buffer):
             opening_seq = int(match.group(1))
             word = match.group(2)
             closing_seq = int(match.group(3))
@@ -116,15 +138,20 @@ class XMLStreamProcessor:
                 pr_warn(f"XML tag mismatch: <{opening_seq}>...</{closing_seq}> (using opening tag {opening_seq})")
 
             # Unescape XML entities in tag content
-            word = self._unescape_xml_entities(word)
+            if '&' in word:
+                word = self._unescape_xml_entities(word)
+            if len(word) <= _INTERN_MAX_LEN:
+                word = sys.intern(word)
             updates.append((opening_seq, word))
             last_end = match.end()
-            self._debug(f"        Found complete tag: seq={opening_seq}, word='{word}')")
+            if debug:
+                self._debug(f"        Found complete tag: seq={opening_seq}, word='{word}')")
 
         # Return remaining buffer after last complete match
         remaining_buffer = buffer[last_end:]
-        self._debug(f"        Remaining buffer: '{remaining_buffer}')")
-        self._debug(f"        Returning updates: {updates}")
+        if debug:
+            self._debug(f"        Remaining buffer: '{remaining_buffer}')")
+            self._debug(f"        Returning updates: {updates}")
         return updates, remaining_buffer
     
     def _process_single_update(self, seq: int, word: str) -> None:
@@ -155,8 +182,14 @@ class XMLStreamProcessor:
             # Reset last_emitted_seq since we backspaced
             self.last_emitted_seq = seq - 1 if seq > 1 else 0
 
-        # Update the word
-        self.current_words[seq] = word
+        # Update the word, keeping the sorted sequence list in step with new keys
+        if seq not in self.current_words:
+            seqs = self._sorted_seqs()
+            self.current_words[seq] = word
+            bisect.insort(seqs, seq)
+        else:
+            self.current_words[seq] = word
+        self.version += 1
 
         if self.backspace_performed:
             # Emit up to this sequence
@@ -165,17 +198,11 @@ class XMLStreamProcessor:
     
     def _calculate_backspace_count(self, first_changed_seq: int) -> int:
         """Calculate number of characters to backspace to chunk boundary."""
-        # Calculate position where first changed chunk starts
-        chunk_start = 0
-        for seq in sorted(self.current_words.keys()):
-            if seq < first_changed_seq:
-                chunk_start += len(self.current_words[seq])
-            else:
-                break
-
-        # Backspace from end to chunk boundary
-        current_length = len(self._build_string_from_words(self.current_words))
-        return current_length - chunk_start
+        # Everything from the first changed chunk to the end is deleted
+        seqs = self._sorted_seqs()
+        start = bisect.bisect_left(seqs, first_changed_seq)
+        words = self.current_words
+        return sum([len(words[seq]) for seq in seqs[start:]])
 
     def _perform_backspace(self, count: int) -> None:
         """Execute keyboard backspace operation."""
@@ -192,8 +219,9 @@ class XMLStreamProcessor:
         self._debug(f"            last_emitted_seq: {self.last_emitted_seq}")
 
         # Find all sequences to emit
-        seqs_to_emit = sorted(k for k in self.current_words.keys()
-                             if self.last_emitted_seq < k <= target_seq)
+        seqs = self._sorted_seqs()
+        seqs_to_emit = seqs[bisect.bisect_right(seqs, self.last_emitted_seq):
+                            bisect.bisect_right(seqs, target_seq)]
         self._debug(f"            seqs_to_emit: {seqs_to_emit}")
 
         # Emit each chunk in order
@@ -207,9 +235,21 @@ class XMLStreamProcessor:
             self.last_emitted_seq = max(seqs_to_emit)
             self._debug(f"            last_emitted_seq = {self.last_emitted_seq}")
     
+    def _sorted_seqs(self) -> List[int]:
+        """Sequence numbers of current_words in ascending order."""
+        words = self.current_words
+        cached_words, seqs = self._seq_cache
+        # Rebuild when the dict was replaced or its keys changed outside _process_single_update
+        if cached_words is not words or len(seqs) != len(words):
+            seqs = sorted(words)
+            self._seq_cache = (words, seqs)
+        return seqs
+
     def _build_string_from_words(self, words: Dict[int, str]) -> str:
         """Build complete string from word dictionary."""
         if not words:
             return ""
-        return ''.join(words[k] for k in sorted(words.keys()))
+        seqs = self._sorted_seqs() if words is self.current_words else sorted(words)
+        # A list lets join size the result in one pass; a generator is consumed into one anyway
+        return ''.join([words[k] for k in seqs])
     
@@ -2,12 +2,16 @@
 
 import sounddevice as sd
 import numpy as np
-import queue
+import os
 import sys
+import threading
 import time
 from typing import Optional
 from audio_source import AudioSource, AudioResult, AudioDataResult, AudioChunkHandler, DefaultAudioChunkHandler
+from lib.audio_capture_buffer import AudioCaptureBuffer
 from lib.pr_log import pr_emerg, pr_err, pr_warn, pr_info, pr_debug
+from lib.thread_qos import set_background_qos
+from lib.worker_pool import WorkerPool
 
 
 class MicrophoneAudioSource(AudioSource):
@@ -24,14 +28,41 @@ class MicrophoneAudioSource(AudioSource):
         np.dtype('float64'): 1.0,
     }
 
+    # Minimum capture storage segment length; the capture worker adds segments ahead of need
+    BUFFER_SEGMENT_SECONDS = 30
+
+    # How often the capture worker reserves storage and hands complete batches to the handler
+    CAPTURE_POLL_SECONDS = 0.02
+
+    # SCHED_FIFO priority requested for the PortAudio callback thread (Linux, needs CAP_SYS_NICE)
+    CALLBACK_RT_PRIORITY = 10
+
+    # Default input device, queried once per process (PortAudio enumerates devices at init)
+    _input_device_info = None
+
     def __init__(self, config, dtype: str = 'int16', chunk_handler: Optional[AudioChunkHandler] = None):
         super().__init__(config)
         self.dtype = dtype
-        self._is_recording = False
-        self.audio_queue = queue.Queue()
+        self._recording = threading.Event()
+        self.audio_buffer: Optional[AudioCaptureBuffer] = None
         self.recording_stream = None
         self.chunk_handler = chunk_handler or DefaultAudioChunkHandler()
+        # Bound once; None skips batching entirely without a handler
+        self._on_chunk = chunk_handler.on_chunk if chunk_handler is not None else None
+        self._chunk_batch_frames = 0
+        # Stream time of the first captured block, set by the callback
+        self._capture_start_time: Optional[float] = None
+        # Long-lived worker that grows capture storage and delivers handler batches,
+        # keeping both off the audio callback; one job per recording
+        self._capture_pool: Optional[WorkerPool] = None
+        self._capture_stop: Optional[threading.Event] = None
+        self._capture_done: Optional[threading.Event] = None
+        self._callback_priority_checked = False
+        self._callback_priority_error = None
         self.recording_start_time = None
+        self._overflow_count = 0
+        self._status_count = 0
+        self._last_status = None
 
     def _get_max_value_for_dtype(self, dtype: np.dtype) -> float:
         """
@@ -55,6 +86,13 @@ class MicrophoneAudioSource(AudioSource):
             )
         return self.DTYPE_MAX_VALUES[dtype]
 
+    @classmethod
+    def _get_input_device(cls) -> dict:
+        """Return the cached default input device info, querying PortAudio on first use."""
+        if cls._input_device_info is None:
+            cls._input_device_info = sd.query_devices(kind='input')
+        return cls._input_device_info
+
     def initialize(self) -> bool:
         """Initialize the microphone audio source."""
         try:
@@ -68,50 +106,160 @@ class MicrophoneAudioSource(AudioSource):
 
     def audio_callback(self, indata, frames, time_info, status):
         """This is called (from a separate thread) for each audio block."""
+        if not self._callback_priority_checked:
+            self._raise_callback_priority()
+
+        # Only count here; logging from the realtime thread can stall on stdout
         if status:
             if status.input_overflow:
-                pr_warn("Audio buffer overflow")
+                self._overflow_count += 1
             else:
-                pr_warn(f"Audio callback status: {status}")
+                self._status_count += 1
+                self._last_status = status
+
+        if self._recording.is_set():
+            if self._capture_start_time is None:
+                self._capture_start_time = time_info.currentTime if time_info else 0.0
+            # Copy straight into reserved storage; indata is reused by PortAudio.
+            # The capture worker picks the frames up from there for the handler.
+            self.audio_buffer.write(indata)
+
+    def _raise_callback_priority(self) -> None:
+        """Request realtime scheduling for the calling (PortAudio callback) thread, once per stream."""
+        self._callback_priority_checked = True
+        if not hasattr(os, 'sched_setscheduler'):
+            return
+        try:
+            # pid 0 targets the calling thread on Linux
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.CALLBACK_RT_PRIORITY))
+        except OSError as e:
+            self._callback_priority_error = e
+
+    def _start_capture_worker(self) -> None:
+        """Hand the new recording's storage to the capture worker."""
+        if self._capture_pool is None:
+            # Handlers may run inference; keep them from preempting the capture callback
+            self._capture_pool = WorkerPool(self._service_capture, 1, name="AudioCapture",
+                                            initializer=set_background_qos)
+            self._capture_pool.start()
+        self._capture_stop = threading.Event()
+        self._capture_done = threading.Event()
+        self._capture_pool.submit(self.audio_buffer, self._capture_stop, self._capture_done)
+
+    def _service_capture(self, audio_buffer: AudioCaptureBuffer, stop: threading.Event,
+                         done: threading.Event) -> None:
+        """Capture worker job: reserve storage and deliver batches until the recording stops."""
+        delivered = 0
+        try:
+            while True:
+                stopping = stop.wait(self.CAPTURE_POLL_SECONDS)
+                audio_buffer.reserve()
+                if self._on_chunk is not None:
+                    delivered = self._deliver_batches(audio_buffer, delivered, final=stopping)
+                if stopping:
+                    break
+        finally:
+            done.set()
+
+    def _deliver_batches(self, audio_buffer: AudioCaptureBuffer, delivered: int, final: bool) -> int:
+        """
+        Pass complete batches written since delivered to the handler.
 
-        if self._is_recording:
-            chunk_copy = indata.copy()
-            # Allow handler to intercept chunk
-            self.chunk_handler.on_chunk(chunk_copy, time_info.currentTime if time_info else 0.0)
-            # Store for final result
-            self.audio_queue.put(chunk_copy)
+        With final set, a trailing partial batch is delivered too.
+
+        Returns:
+            Frame index up to which frames have been delivered
+        """
+        written = audio_buffer.frames_written
+        batch_frames = self._chunk_batch_frames if self._chunk_batch_frames > 0 else written - delivered
+        while delivered < written and (written - delivered >= batch_frames or final):
+            end = min(delivered + batch_frames, written)
+            timestamp = (self._capture_start_time or 0.0) + delivered / self.config.sample_rate
+            try:
+                self._on_chunk(audio_buffer.frames(delivered, end), timestamp)
+            except Exception as e:
+                pr_err(f"Error in audio chunk handler: {e}")
+            delivered = end
+        return delivered
+
+    def _stop_capture_worker(self) -> None:
+        """Wait until the worker has delivered every captured frame and finished this recording."""
+        if self._capture_stop is None:
+            return
+        self._capture_stop.set()
+        self._capture_done.wait()
+        self._capture_stop = None
+        self._capture_done = None
 
     def start_recording(self) -> None:
         """Starts the audio recording stream."""
-        if self._is_recording:
+        if self._recording.is_set():
             return
 
         pr_info("Recording started...")
-        self._is_recording = True
         self.recording_start_time = time.time()
-        self.audio_queue.queue.clear()
+        self._overflow_count = 0
+        self._status_count = 0
+        self._last_status = None
+        self._callback_priority_checked = False
+        self._callback_priority_error = None
+        self._chunk_batch_frames = self.config.chunk_batch_ms * self.config.sample_rate // 1000
+        self._capture_start_time = None
+        # Fresh storage per recording: the previous result may still be in use.
+        # Segments are sized to the longest recording so far, so long dictation
+        # usually fits one segment and stop_recording returns a view, not a copy.
+        segment_frames = self.BUFFER_SEGMENT_SECONDS * self.config.sample_rate
+        if self.audio_buffer is not None:
+            segment_frames = max(segment_frames, self.audio_buffer.segment_frames,
+                                 self.audio_buffer.frames_written)
+        self.audio_buffer = AudioCaptureBuffer(
+            segment_frames,
+            self.config.channels,
+            self.dtype
+        )
+        self._start_capture_worker()
+        # Set only once storage exists; the callback checks this flag
+        self._recording.set()
 
         try:
             self.recording_stream = sd.InputStream(
+                device=self._get_input_device()['index'],
                 samplerate=self.config.sample_rate,
                 channels=self.config.channels,
                 dtype=self.dtype,
+                blocksize=self._stream_blocksize(),
+                latency=self.config.audio_latency,
                 callback=self.audio_callback
             )
             self.recording_stream.start()
         except sd.PortAudioError as e:
             pr_err(f"Error starting audio stream: {e}")
             pr_err("Check audio device settings and permissions.")
-            self._is_recording = False
+            self._recording.clear()
             self.recording_stream = None
+            self._stop_capture_worker()
         except Exception as e:
             pr_err(f"Unexpected error during recording start: {e}")
-            self._is_recording = False
+            self._recording.clear()
             self.recording_stream = None
+            self._stop_capture_worker()
+
+    def _stream_blocksize(self) -> int:
+        """
+        Frames per callback for the next stream.
+
+        Batch recordings keep the configured (large) block. With a streaming
+        chunk handler, blocks are capped at the handler batch size, since a
+        batch cannot be flushed before the block that completes it arrives.
+        """
+        blocksize = self.config.audio_blocksize
+        if self._on_chunk is not None and blocksize > 0 and self._chunk_batch_frames > 0:
+            return min(blocksize, self._chunk_batch_frames)
+        return blocksize
 
     def stop_recording(self) -> AudioResult:
         """Stops recording and returns the audio result."""
-        if not self._is_recording:
+        if not self._recording.is_set():
             # Return empty result if not recording
             return AudioDataResult(
                 audio_data=np.array([], dtype=self.dtype),
@@ -119,7 +267,7 @@ class MicrophoneAudioSource(AudioSource):
             )
 
         pr_info("Stopped. Processing...")
-        self._is_recording = False
+        self._recording.clear()
 
         if self.recording_stream:
             try:
@@ -132,36 +280,21 @@ class MicrophoneAudioSource(AudioSource):
             finally:
                 self.recording_stream = None
 
-        audio_data = []
-        while not self.audio_queue.empty():
-            try:
-                audio_data.append(self.audio_queue.get_nowait())
-            except queue.Empty:
-                break
+        # Stream is stopped; wait until the handler has had every frame, including a partial batch
+        self._stop_capture_worker()
+        self._report_callback_status()
 
-        if not audio_data:
-            pr_info("No audio data recorded.")
-            return AudioDataResult(
-                audio_data=np.array([], dtype=self.dtype),
-                sample_rate=self.config.sample_rate
-            )
+        # A view of capture storage unless the recording spans several segments
+        full_audio = self.audio_buffer.frames()
 
-        try:
-            full_audio = np.concatenate(audio_data, axis=0)
-        except ValueError as e:
-            pr_err(f"Error concatenating audio data: {e}")
-            return AudioDataResult(
-                audio_data=np.array([], dtype=self.dtype),
-                sample_rate=self.config.sample_rate
-            )
-        except Exception as e:
-            pr_err(f"Unexpected error combining audio: {e}")
+        if len(full_audio) == 0:
+            pr_info("No audio data recorded.")
             return AudioDataResult(
                 audio_data=np.array([], dtype=self.dtype),
                 sample_rate=self.config.sample_rate
             )
 
-        pr_debug(f"Audio data: chunks={len(audio_data)} shape={full_audio.shape} dtype={full_audio.dtype} min={np.min(full_audio)} max={np.max(full_audio)} samples={len(full_audio)}")
+        pr_debug(f"Audio data: shape={full_audio.shape} dtype={full_audio.dtype} min={np.min(full_audio)} max={np.max(full_audio)} samples={len(full_audio)}")
 
         if not self._validate_recording(full_audio):
             return AudioDataResult(
@@ -174,9 +307,21 @@ class MicrophoneAudioSource(AudioSource):
             sample_rate=self.config.sample_rate
         )
 
+    def _report_callback_status(self) -> None:
+        """Log audio callback status counts collected during the recording."""
+        if self._overflow_count:
+            pr_warn(f"Audio buffer overflow ({self._overflow_count} blocks)")
+        if self._status_count:
+            pr_warn(f"Audio callback status: {self._last_status} ({self._status_count} blocks)")
+        if self.audio_buffer is not None and self.audio_buffer.dropped_blocks:
+            pr_warn(f"Audio dropped: capture storage not reserved in time "
+                    f"({self.audio_buffer.dropped_frames} frames in {self.audio_buffer.dropped_blocks} blocks)")
+        if self._callback_priority_error is not None:
+            pr_debug(f"Audio callback realtime priority unavailable: {self._callback_priority_error}")
+
     def is_recording(self) -> bool:
         """Check if currently recording."""
-        return self._is_recording
+        return self._recording.is_set()
 
     def _validate_recording(self, audio_data: np.ndarray) -> bool:
         """
@@ -197,8 +342,9 @@ class MicrophoneAudioSource(AudioSource):
 
         max_value = self._get_max_value_for_dtype(audio_data.dtype)
 
-        abs_audio = np.abs(audio_data.flatten())
-        peak_amplitude = np.max(abs_audio)
+        # Two reductions instead of an abs() copy of the whole recording; as
+        # Python scalars, -min cannot wrap for a full-scale negative sample
+        peak_amplitude = max(audio_data.max().item(), -audio_data.min().item())
 
         threshold = self.config.audio_amplitude_threshold * max_value
         if np.issubdtype(audio_data.dtype, np.integer):
@@ -216,21 +362,23 @@ class MicrophoneAudioSource(AudioSource):
         if np.issubdtype(audio_data.dtype, np.integer):
             rms_threshold = int(rms_threshold)
 
-        if len(abs_audio) < window_size:
+        if audio_data.size < window_size:
             pr_warn(f"Recording discarded: audio too short for RMS window analysis")
             return False
 
-        audio_flat = audio_data.flatten().astype(np.float64)
+        audio_flat = audio_data.astype(np.float64).ravel()
         step_size = max(1, window_size // 10)
 
         num_windows = (len(audio_flat) - window_size) // step_size + 1
-        rms_values = np.zeros(num_windows)
 
-        for i in range(num_windows):
-            start = i * step_size
-            end = start + window_size
-            window = audio_flat[start:end]
-            rms_values[i] = np.sqrt(np.mean(window ** 2))
+        # Window sums of squares from one running sum instead of a loop over windows
+        cumulative = np.empty(len(audio_flat) + 1)
+        cumulative[0] = 0.0
+        np.cumsum(audio_flat * audio_flat, out=cumulative[1:])
+        starts = np.arange(num_windows) * step_size
+        window_sums = cumulative[starts + window_size] - cumulative[starts]
+        # Rounding in the running sum can leave tiny negatives for silent windows
+        rms_values = np.sqrt(np.maximum(window_sums, 0.0) / window_size)
 
         peak_rms = np.max(rms_values)
         peak_rms_percent = (peak_rms / max_value) * 100
@@ -245,16 +393,17 @@ class MicrophoneAudioSource(AudioSource):
         return True
 
     def test_audio_device(self):
-        """Test if audio device is working."""
+        """Test if audio device supports the configured stream settings."""
         try:
-            with sd.InputStream(
-                samplerate=self.config.sample_rate,
+            device = self._get_input_device()
+            # Validates settings against the device without opening a stream
+            sd.check_input_settings(
+                device=device['index'],
                 channels=self.config.channels,
                 dtype=self.dtype,
-                callback=lambda i, f, t, s: None
-            ):
-                pass
-            pr_info("Audio device check successful.")
+                samplerate=self.config.sample_rate
+            )
+            pr_info(f"Audio device check successful: {device['name']}")
             return True
         except sd.PortAudioError as e:
             pr_emerg(f"Audio device error: {e}")
@@ -273,4 +422,6 @@ class MicrophoneAudioSource(AudioSource):
                 self.recording_stream.close()
                 pr_info("Audio stream stopped.")
             except Exception:
-                pass
\ No newline at end of file
+                pass
+        if self._capture_pool:
+            self._capture_pool.shutdown()
@@ -4,7 +4,7 @@ Runs in parallel to invoke transcription models asynchronously.
 """
 from typing import Optional
 from processing_session import ProcessingSession
-from audio_source import AudioResult, AudioDataResult, AudioTextResult
+from audio_source import AudioResult, AudioDataResult, AudioTextResult, AudioPendingTextResult
 from lib.pr_log import pr_err
 from litellm import exceptions as litellm_exceptions
 
@@ -13,7 +13,7 @@ def invoke_model_for_session(provider, session: ProcessingSession, result: Audio
     """
     Thread worker that invokes model and writes chunks to session queue.
 
-    This function runs in a daemon thread spawned by ProcessingCoordinator.
+    This function runs on a ProcessingCoordinator model invocation worker thread.
     It routes the audio result to the appropriate model invocation based on type.
     """
     if not provider:
@@ -21,6 +21,13 @@ def invoke_model_for_session(provider, session: ProcessingSession, result: Audio
         return
 
     try:
+        if isinstance(result, AudioPendingTextResult):
+            result = result.transcribe()
+            if not result.transcribed_text:
+                session.is_empty = True
+                session.chunks_complete.set()
+                return
+
         if isinstance(result, AudioDataResult):
             _invoke_model(provider, session, audio_data=result.audio_data)
         elif isinstance(result, AudioTextResult):
@@ -1,13 +1,14 @@
 """
 Processing Coordinator - Orchestrates the two-queue processing pipeline.
 """
-import threading
 from typing import Optional
 from recording_session import RecordingSession
 from processing_session import ProcessingSession
-from audio_source import AudioResult, AudioDataResult, AudioTextResult
+from audio_source import AudioResult, AudioDataResult, AudioTextResult, AudioPendingTextResult
 from providers.conversation_context import ConversationContext
 from lib.event_queue import EventQueue
+from lib.worker_pool import WorkerPool
+from lib.thread_qos import set_interactive_qos
 from lib.pr_log import pr_info
 from ui import AppState
 
@@ -15,22 +16,35 @@ from ui import AppState
 class ProcessingCoordinator:
     """Orchestrates parallel model invocation and sequential output processing."""
 
+    # Concurrent model invocations; further recordings wait for a free worker
+    MODEL_INVOCATION_WORKERS = 4
+
     def __init__(self, provider, transcription_service, config, app):
         self.provider = provider
         self.transcription_service = transcription_service
         self.config = config
         self.app = app
         self.session_queue = None
+        self.invocation_pool = None
 
     def initialize(self):
-        """Initialize the session processing queue."""
+        """Initialize the session processing queue and model invocation workers."""
         from session_output_worker import process_session_output
+        from model_invocation_worker import invoke_model_for_session
 
         self.session_queue = EventQueue(
             lambda s: process_session_output(self.app, s),
             name="SessionProcessor"
         )
         self.session_queue.start()
+
+        self.invocation_pool = WorkerPool(
+            invoke_model_for_session,
+            self.MODEL_INVOCATION_WORKERS,
+            name="ModelInvocation",
+            initializer=set_interactive_qos
+        )
+        self.invocation_pool.start()
         return True
 
     def process_recording_result(
@@ -52,12 +66,7 @@ class ProcessingCoordinator:
         processing_session = ProcessingSession(session, context, result)
         self.session_queue.enqueue(processing_session)
 
-        from model_invocation_worker import invoke_model_for_session
-        threading.Thread(
-            target=invoke_model_for_session,
-            args=(self.provider, processing_session, result),
-            daemon=True
-        ).start()
+        self.invocation_pool.submit(self.provider, processing_session, result)
 
         self.app._show_recording_prompt()
 
@@ -76,9 +85,19 @@ class ProcessingCoordinator:
             if not result.transcribed_text:
                 return False
 
+        if isinstance(result, AudioPendingTextResult):
+            if len(result.audio_data) == 0:
+                return False
+
         return True
 
     def shutdown(self):
-        """Shutdown the session queue."""
+        """Shutdown the session queue and model invocation workers."""
+        # Let workers blocked on long responses finish instead of timing out
+        cancel = getattr(self.provider, 'cancel', None)
+        if cancel:
+            cancel()
         if self.session_queue:
             self.session_queue.shutdown()
+        if self.invocation_pool:
+            self.invocation_pool.shutdown()
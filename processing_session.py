@@ -9,6 +9,28 @@ from providers.conversation_context import ConversationContext
 from audio_source import AudioResult
 
 
+# Queued after the final chunk so consumers can block on get() instead of polling
+END_OF_CHUNKS = object()
+
+
+class ChunksCompleteEvent(threading.Event):
+    """Completion event that also wakes a consumer blocked on the chunk queue."""
+
+    def __init__(self, chunk_queue: queue.Queue):
+        super().__init__()
+        self._chunk_queue = chunk_queue
+        # Makes check, set and enqueue one step, so concurrent callers add one marker
+        self._set_lock = threading.Lock()
+
+    def set(self) -> None:
+        """Mark chunk stream complete and enqueue the end-of-chunks marker once."""
+        with self._set_lock:
+            if self.is_set():
+                return
+            super().set()
+            self._chunk_queue.put(END_OF_CHUNKS)
+
+
 class ProcessingSession:
     """Processing infrastructure for a recording session."""
 
@@ -22,8 +44,10 @@ class ProcessingSession:
         self.context: ConversationContext = context
         self.audio_result: AudioResult = audio_result
         self.chunk_queue: queue.Queue = queue.Queue()
-        self.chunks_complete: threading.Event = threading.Event()
+        self.chunks_complete: threading.Event = ChunksCompleteEvent(self.chunk_queue)
         self.error_message: Optional[str] = None
+        # Set when deferred transcription produced no text; nothing is output
+        self.is_empty: bool = False
 
     @property
     def has_error(self) -> bool:
@@ -3,22 +3,48 @@ Base provider class with common XML instructions.
 """
 from typing import Optional
 import numpy as np
+import concurrent.futures
+import os
+import re
 import time
 import sys
+import threading
+import traceback
 import base64
-import io
-import soundfile as sf
 from .conversation_context import ConversationContext
 from .mapper_factory import MapperFactory
 from instruction_composer import InstructionComposer
+from lib.wav_encoder import WAV_HEADER_SIZE, encode_mulaw_wav, encode_pcm16_wav_view
 from lib.pr_log import (
     pr_emerg, pr_alert, pr_crit, pr_err, pr_warn, pr_notice, pr_info, pr_debug,
     get_streaming_handler
 )
 
 
+# Seconds between console prints of streamed model output
+STREAM_ECHO_INTERVAL = 0.05
+
+# Largest base64-encoded WAV payload sent inline; providers reject requests of about 20 MB
+MAX_INLINE_AUDIO_BYTES = 18 * 1024 * 1024
+
+# Fixed user-message text, built once rather than per request
+NO_CONTEXT_NOTICE = (
+    "CRITICAL: No prior conversation. There is nothing to modify. ALL input must be treated as DICTATION. "
+    "Transcribe according to system instructions (append with incrementing IDs starting from 10)."
+)
+MECHANICAL_TRANSCRIPTION_NOTES = (
+    "\n\nCRITICAL: The 'mechanical transcription' above is raw output from automatic speech recognition. It requires the SAME analysis as audio input:"
+    "\n- Treat as if you just heard the audio yourself"
+    "\n- Identify sound-alike errors: \"there/their\", \"to/too\", \"no/know\", etc."
+    "\n- Fix misrecognized words based on context"
+    "\n- Apply ALL copy editing and formatting rules"
+    "\n- Handle false starts, fillers, and speech patterns"
+    "\n- Generate TX (literal with sound-alike options), INT (clean edited), UPDATE (XML tags)"
+)
+
+
 class TerminateStream(Exception):
-    """Signal to terminate streaming when </xml> tag is detected."""
+    """Signal to terminate streaming when </xml> tag is detected or the request is cancelled."""
     pass
 
 
@@ -64,6 +90,15 @@ class BaseProvider:
         # Validation results (populated after initialize)
         self._validation_results = None
 
+        # Instructions composed ahead of the next request: (key, text)
+        self._prepared_instructions = None
+
+        # Request parameters that do not change between transcriptions (built on first use)
+        self._completion_params = None
+
+        # Incremented by cancel(); streams started under an older value stop
+        self._cancel_generation = 0
+
     def _extract_provider(self, model_without_route: str) -> str:
         """Extract provider from model (format: provider/model)."""
         if '/' in model_without_route:
@@ -83,9 +118,6 @@ class BaseProvider:
                   text_response, audio_passed, audio_error, audio_response, combined1_passed,
                   combined1_error, combined1_response, combined2_passed, combined2_error, combined2_response
         """
-        import concurrent.futures
-        import re
-
         text_error = None
         text_response = None
         audio_error = None
@@ -235,8 +267,6 @@ class BaseProvider:
         # Determine overall success
         overall_success = all_passed or (self.config.audio_source == 'raw' and audio_only_passed)
 
-        from lib.pr_log import pr_info, pr_warn, pr_err
-
         # Helper to format response for display (replace newlines with space)
         def format_response(resp):
             if resp:
@@ -330,6 +360,9 @@ class BaseProvider:
             if self.config.audio_source in ['transcribe', 'trans']:
                 pr_info("Skipping validation when using local transcription")
                 self._initialized = True
+                # Nothing has contacted the provider yet; opening the connection costs a request
+                if self.config.warm_connection:
+                    threading.Thread(target=self._warm_connection, name="ProviderWarmup", daemon=True).start()
                 return True
 
             # Generate minimal test audio (0.1 second silence)
@@ -337,7 +370,7 @@ class BaseProvider:
             test_audio_silence_b64 = self._encode_audio_to_base64(test_audio_silence, self.config.sample_rate)
 
             # Load sumtest.wav for audio intelligence test
-            import os
+            import soundfile as sf
             sumtest_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'samples', 'sumtest.wav')
             sumtest_audio, sumtest_sr = sf.read(sumtest_path)
             if sumtest_audio.dtype != np.int16:
@@ -376,6 +409,25 @@ class BaseProvider:
             pr_err(f"Error initializing LiteLLM: {e}")
             return False
 
+    def _warm_connection(self) -> None:
+        """Send a one-token request so the first dictation reuses an open, authenticated connection."""
+        completion_params = {
+            "model": self.model_without_route,
+            "messages": [{"role": "user", "content": "ok"}],
+            "max_tokens": 1,
+            "stream": False
+        }
+        if self.route:
+            completion_params["route"] = self.route
+        if self.config.api_key:
+            completion_params["api_key"] = self.config.api_key
+
+        try:
+            self.litellm.completion(**completion_params)
+            pr_debug("Provider connection warmed")
+        except Exception as e:
+            pr_debug(f"Provider connection warm-up failed: {e}")
+
     def is_initialized(self) -> bool:
         """Check if provider is initialized."""
         return self._initialized and self.litellm is not None
@@ -387,22 +439,9 @@ class BaseProvider:
 
     def _encode_audio_to_base64(self, audio_np: np.ndarray, sample_rate: int) -> str:
         """Encode audio numpy array to base64 WAV string."""
-        wav_bytes_io = io.BytesIO()
-        sf.write(wav_bytes_io, audio_np, sample_rate, format='WAV', subtype='PCM_16')
-        wav_bytes = wav_bytes_io.getvalue()
-        wav_bytes_io.close()
-        return base64.b64encode(wav_bytes).decode('utf-8')
-
-    def _build_prompt(self, context: ConversationContext) -> str:
-        """Build prompt from XML instructions and conversation context."""
-        xml_instructions = self.get_xml_instructions()
-        prompt = xml_instructions
-
-        if context.xml_markup:
-            prompt += f"\n\nCurrent conversation XML: {context.xml_markup}"
-            prompt += f"\nCurrent conversation text: {context.compiled_text}"
-
-        return prompt
+        if self.config.audio_encoding == 'ulaw':
+            return base64.b64encode(encode_mulaw_wav(audio_np, sample_rate)).decode('ascii')
+        return base64.b64encode(encode_pcm16_wav_view(audio_np, sample_rate)).decode('ascii')
 
     def _process_streaming_response(self, response, streaming_callback=None, final_callback=None):
         """Process streaming response chunks from LiteLLM completion."""
@@ -413,10 +452,13 @@ class BaseProvider:
         reasoning_header_shown = False
         thinking_header_shown = False
         output_header_shown = False
+        generation = self._cancel_generation
 
         try:
-            with get_streaming_handler() as stream:
+            with get_streaming_handler(STREAM_ECHO_INTERVAL) as stream:
                 for chunk in response:
+                    if self._cancel_generation != generation:
+                        raise TerminateStream("request cancelled")
                     last_chunk = chunk
                     delta = chunk.choices[0].delta
 
@@ -446,15 +488,15 @@ class BaseProvider:
                         accumulated_text += chunk_text
 
                         if '</xml>' in accumulated_text:
-                            raise TerminateStream()
+                            raise TerminateStream("</xml> tag detected")
 
                     if hasattr(chunk, 'usage') and chunk.usage is not None:
                         usage_data = chunk.usage
 
-        except TerminateStream:
+        except TerminateStream as e:
             if hasattr(response, 'completion_stream') and hasattr(response.completion_stream, 'close'):
                 response.completion_stream.close()
-            pr_debug("Stream terminated: </xml> tag detected")
+            pr_debug(f"Stream terminated: {e}")
 
         self._print_timing_stats()
 
@@ -483,9 +525,23 @@ class BaseProvider:
             pr_err("Provider not initialized.")
             return
 
+        if audio_data is not None:
+            # Size is known from the sample count, so reject before encoding
+            sample_bytes = audio_data.size if self.config.audio_encoding == 'ulaw' else audio_data.nbytes
+            # Base64 sends every 3 bytes (last group padded) as 4 characters
+            encoded_size = 4 * ((WAV_HEADER_SIZE + sample_bytes + 2) // 3)
+            if encoded_size > MAX_INLINE_AUDIO_BYTES:
+                pr_err(f"Recording too large to send ({encoded_size / (1024 * 1024):.1f} MB > "
+                       f"{MAX_INLINE_AUDIO_BYTES // (1024 * 1024)} MB). Record shorter segments.")
+                return
+
         try:
-            # Get instructions (includes audio processor if set)
-            xml_instructions = self.get_xml_instructions()
+            # Get instructions (includes audio processor if set), composed while recording if possible
+            prepared = self._prepared_instructions
+            if prepared is not None and prepared[0] == self._instructions_key():
+                xml_instructions = prepared[1]
+            else:
+                xml_instructions = self.get_xml_instructions()
 
             # System message: Static instructions (cached)
             system_content = {"type": "text", "text": xml_instructions}
@@ -498,43 +554,19 @@ class BaseProvider:
                 "content": [system_content]
             }
 
-            # Build user content based on input type
+            # Build user content based on input type; both share the context preamble
+            preamble = self._context_preamble(context)
             if audio_data is not None:
                 # Audio input
                 audio_b64 = self._encode_audio_to_base64(audio_data, context.sample_rate)
-                user_content = []
-
-                if context.xml_markup:
-                    context_text = f"Current conversation XML: {context.xml_markup}"
-                    context_text += f"\nCurrent conversation text: {context.compiled_text}"
-                    user_content.append({"type": "text", "text": context_text})
-                else:
-                    context_text = "CRITICAL: No prior conversation. There is nothing to modify. ALL input must be treated as DICTATION. Transcribe according to system instructions (append with incrementing IDs starting from 10)."
-                    user_content.append({"type": "text", "text": context_text})
-
-                user_content.append({"type": "input_audio", "input_audio": {"data": audio_b64, "format": "wav"}})
+                user_content = [
+                    {"type": "text", "text": preamble},
+                    {"type": "input_audio", "input_audio": {"data": audio_b64, "format": "wav"}}
+                ]
             else:
                 # Text input
-                user_text = ""
-
-                if context.xml_markup:
-                    user_text += f"Current conversation XML: {context.xml_markup}"
-                    user_text += f"\nCurrent conversation text: {context.compiled_text}"
-                    user_text += "\n\n"
-                else:
-                    user_text += "CRITICAL: No prior conversation. There is nothing to modify. ALL input must be treated as DICTATION. Transcribe according to system instructions (append with incrementing IDs starting from 10).\n\n"
-
-                user_text += f"NEW INPUT (requires processing):"
-                user_text += f"\nMechanical transcription: {text_data}"
-                user_text += "\n\nCRITICAL: The 'mechanical transcription' above is raw output from automatic speech recognition. It requires the SAME analysis as audio input:"
-                user_text += "\n- Treat as if you just heard the audio yourself"
-                user_text += "\n- Identify sound-alike errors: \"there/their\", \"to/too\", \"no/know\", etc."
-                user_text += "\n- Fix misrecognized words based on context"
-                user_text += "\n- Apply ALL copy editing and formatting rules"
-                user_text += "\n- Handle false starts, fillers, and speech patterns"
-                user_text += "\n- Generate TX (literal with sound-alike options), INT (clean edited), UPDATE (XML tags)"
-
-                user_content = user_text
+                user_content = (f"{preamble}\n\nNEW INPUT (requires processing):"
+                                f"\nMechanical transcription: {text_data}{MECHANICAL_TRANSCRIPTION_NOTES}")
 
             messages = [
                 system_message,
@@ -546,30 +578,9 @@ class BaseProvider:
             self.start_model_timer()
 
             # Call LiteLLM
-            completion_params = {
-                "model": self.model_without_route,
-                "messages": messages,
-                "stream": True,
-                "stream_options": {"include_usage": True},
-                "temperature": self.config.temperature
-            }
-
-            if self.route:
-                completion_params["route"] = self.route
-
-            if self.config.max_tokens is not None:
-                completion_params["max_tokens"] = self.config.max_tokens
-
-            if self.config.api_key:
-                completion_params["api_key"] = self.config.api_key
-
-            # Map reasoning parameters via provider-specific mapper
-            if self.mapper.supports_reasoning(self.model_without_route):
-                reasoning_params = self.mapper.map_reasoning_params(
-                    self.config.enable_reasoning,
-                    self.config.thinking_budget
-                )
-                completion_params.update(reasoning_params)
+            if self._completion_params is None:
+                self._completion_params = self._build_completion_params()
+            completion_params = {**self._completion_params, "messages": messages}
 
             response = self.litellm.completion(**completion_params)
 
@@ -584,28 +595,88 @@ class BaseProvider:
             operation = "audio transcription" if audio_data is not None else "text processing"
             self._handle_provider_error(e, operation)
     
-    def get_xml_instructions(self) -> str:
-        """Get the composed XML instructions from files."""
-        # Determine audio source name for instruction loading
-        audio_source_name = None
+    def cancel(self) -> None:
+        """
+        Stop streaming responses that are in flight.
+
+        Each stream closes its connection when the next chunk arrives.
+        Requests started afterwards are not affected.
+        """
+        self._cancel_generation += 1
+
+    def _build_completion_params(self) -> dict:
+        """Build the completion parameters shared by every transcribe() call."""
+        completion_params = {
+            "model": self.model_without_route,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            "temperature": self.config.temperature
+        }
+
+        if self.route:
+            completion_params["route"] = self.route
+
+        if self.config.max_tokens is not None:
+            completion_params["max_tokens"] = self.config.max_tokens
+
+        if self.config.api_key:
+            completion_params["api_key"] = self.config.api_key
+
+        # Map reasoning parameters via provider-specific mapper
+        if self.mapper.supports_reasoning(self.model_without_route):
+            reasoning_params = self.mapper.map_reasoning_params(
+                self.config.enable_reasoning,
+                self.config.thinking_budget
+            )
+            completion_params.update(reasoning_params)
+
+        return completion_params
+
+    def _instruction_audio_source(self) -> Optional[str]:
+        """Determine audio source name for instruction loading."""
         if self.config.audio_source in ['transcribe', 'trans']:
             transcription_lower = self.config.transcription_model.lower()
             if 'wav2vec2' in transcription_lower or 'huggingface' in transcription_lower:
-                audio_source_name = 'wav2vec2'
+                return 'wav2vec2'
             elif 'vosk' in transcription_lower:
-                audio_source_name = 'vosk'
+                return 'vosk'
             elif 'whisper' in transcription_lower:
-                audio_source_name = 'whisper'
+                return 'whisper'
+        return None
 
+    def _instructions_key(self) -> tuple:
+        """Inputs that select the composed instructions."""
+        return (self.config.mode, self._instruction_audio_source())
+
+    def get_xml_instructions(self) -> str:
+        """Get the composed XML instructions from files."""
         # Compose instructions from files (reads current mode from config)
         instructions = self.instruction_composer.compose(
             self.config.mode,
-            audio_source_name,
+            self._instruction_audio_source(),
             self.provider
         )
 
         return instructions
 
+    @staticmethod
+    def _context_preamble(context) -> str:
+        """Conversation state sent ahead of new input, or the no-context notice."""
+        if context.xml_markup:
+            return (f"Current conversation XML: {context.xml_markup}"
+                    f"\nCurrent conversation text: {context.compiled_text}")
+        return NO_CONTEXT_NOTICE
+
+    def prepare_request(self) -> None:
+        """
+        Compose instructions for the next transcribe() call.
+
+        Called when recording starts, so instruction file checks and
+        composition overlap audio capture instead of following it.
+        """
+        key = self._instructions_key()
+        self._prepared_instructions = (key, self.get_xml_instructions())
+
 
     def start_model_timer(self):
         """Mark the start of model processing for timing measurements."""
@@ -625,8 +696,6 @@ class BaseProvider:
 
     def _handle_provider_error(self, error: Exception, operation: str) -> None:
         """Common error handling for provider operations with full error details."""
-        import traceback
-
         # Print full error details for debugging
         pr_err(f"ERROR during {operation}:")
         pr_err(f"Error Type: {type(error).__name__}")
@@ -734,33 +803,22 @@ class BaseProvider:
 
     def _display_user_content(self, user_content):
         """Display user content being sent to model."""
-        pr_debug("=" * 60)
-        pr_debug("SENDING TO MODEL:")
+        if not self.config.debug_enabled:
+            return
+
+        lines = ["=" * 60, "SENDING TO MODEL:"]
 
         # Handle list format (audio transcription)
         if isinstance(user_content, list):
             for content_block in user_content:
                 if content_block["type"] == "text":
-                    pr_debug(content_block["text"])
+                    lines.append(content_block["text"])
                 elif content_block["type"] == "input_audio":
-                    pr_debug("Audio: audio_data.wav (base64)")
+                    lines.append("Audio: audio_data.wav (base64)")
         # Handle string format (text transcription)
         else:
-            pr_debug(user_content)
-
-        pr_debug("-" * 60)
-
-    def _get_generation_config(self) -> dict:
-        """Get provider-agnostic generation configuration."""
-        config = {
-            'temperature': self.config.temperature,
-            'enable_reasoning': self.config.enable_reasoning,
-            'response_format': 'text'
-        }
-
-        if self.config.max_tokens is not None:
-            config['max_output_tokens'] = self.config.max_tokens
-
-        # top_p not included - using default to avoid conflicting with temperature
+            lines.append(user_content)
 
-        return config
+        lines.append("-" * 60)
+        # One message: a single lock acquisition and write instead of one per line
+        pr_debug("\n".join(lines))
@@ -8,6 +8,8 @@ from audio_source import AudioResult
 from providers.conversation_context import ConversationContext
 from ui import AppState
 from lib.pr_log import pr_debug, pr_info
+from lib.worker_pool import WorkerPool
+from lib.thread_qos import set_background_qos
 
 
 class RecordingCoordinator:
@@ -19,6 +21,8 @@ class RecordingCoordinator:
         self.config = config
         self.app = app
         self._current_session: Optional[RecordingSession] = None
+        # One background worker, started on first use, prepares provider requests
+        self._prepare_pool: Optional[WorkerPool] = None
 
     def start_recording(self, source: RecordingSource) -> bool:
         """Start recording from specified source."""
@@ -33,9 +37,28 @@ class RecordingCoordinator:
         pr_debug("Calling audio_source.start_recording()")
         self.audio_source.start_recording()
         pr_debug("Recording started")
+        self._prepare_provider_request()
         self.app._update_tray_state(AppState.RECORDING)
         return True
 
+    def _prepare_provider_request(self) -> None:
+        """Let the provider build audio-independent request parts while audio is captured."""
+        provider = self.app.provider
+        if provider is None:
+            return
+
+        if self._prepare_pool is None:
+            # Stay out of the way of the audio callback while recording
+            self._prepare_pool = WorkerPool(lambda p: p.prepare_request(), 1, name="PrepareRequest",
+                                            initializer=set_background_qos)
+            self._prepare_pool.start()
+        self._prepare_pool.submit(provider)
+
+    def shutdown(self) -> None:
+        """Stop the request preparation worker."""
+        if self._prepare_pool:
+            self._prepare_pool.shutdown()
+
     def stop_recording(self) -> tuple[RecordingSession, Optional[AudioResult], ConversationContext]:
         """Stop recording and return session, result, and context."""
         if not self._current_session:
@@ -2,8 +2,7 @@
 EventQueue worker for sequential session output processing.
 Processes transcription chunks and sends keyboard output.
 """
-import queue
-from processing_session import ProcessingSession
+from processing_session import ProcessingSession, END_OF_CHUNKS
 from lib.pr_log import pr_err, pr_info
 
 
@@ -20,15 +19,20 @@ def process_session_output(app, session: ProcessingSession):
 
     app.transcription_service.reset_streaming_state()
 
-    while not session.chunks_complete.is_set() or not session.chunk_queue.empty():
+    # Block until each chunk arrives; chunks_complete enqueues END_OF_CHUNKS last
+    while True:
+        chunk = session.chunk_queue.get()
+        if chunk is END_OF_CHUNKS:
+            break
         try:
-            chunk = session.chunk_queue.get(timeout=0.1)
             app.transcription_service.process_streaming_chunk(chunk)
-        except queue.Empty:
-            continue
         except Exception as e:
             pr_err(f"Error processing chunk: {e}")
 
+    if session.is_empty:
+        app._return_to_idle()
+        return
+
     app.transcription_service.complete_stream()
 
     final_text = app.transcription_service._build_current_text()
@@ -0,0 +1,72 @@
+"""Tests for the segmented capture buffer used by microphone recording."""
+
+import numpy as np
+import pytest
+from lib.audio_capture_buffer import AudioCaptureBuffer
+
+
+def make_block(start, frames, channels=1):
+    """Create a block of sequential int16 samples."""
+    values = np.arange(start, start + frames, dtype=np.int16)
+    return np.repeat(values[:, None], channels, axis=1)
+
+
+def test_writes_span_segments_in_order():
+    """Blocks crossing segment boundaries read back contiguously in order."""
+    buffer = AudioCaptureBuffer(8, 2, np.int16)
+
+    assert buffer.write(make_block(0, 6, channels=2))
+    assert buffer.write(make_block(6, 6, channels=2))
+
+    frames = buffer.frames()
+    assert frames.shape == (12, 2)
+    assert np.array_equal(frames[:, 1], np.arange(12, dtype=np.int16))
+    assert np.array_equal(buffer.frames(5, 9)[:, 0], np.arange(5, 9, dtype=np.int16))
+
+
+def test_range_within_one_segment_is_a_view():
+    """Reads inside a segment share memory with storage."""
+    buffer = AudioCaptureBuffer(8, 1, np.int16)
+    buffer.write(make_block(0, 6))
+
+    assert np.shares_memory(buffer.frames(), buffer._segments[0])
+
+
+def test_write_never_allocates_segments():
+    """Without reserve(), a block past the reserved space is dropped and counted."""
+    buffer = AudioCaptureBuffer(4, 1, np.int16)
+    assert buffer.capacity == 8
+
+    assert buffer.write(make_block(0, 6))
+    assert not buffer.write(make_block(6, 4))
+
+    assert buffer.capacity == 8
+    assert buffer.dropped_blocks == 1
+    assert buffer.dropped_frames == 4
+    assert buffer.frames_written == 6
+
+
+def test_reserve_keeps_spare_segment_ahead():
+    """reserve() adds segments so frames already stored never move."""
+    buffer = AudioCaptureBuffer(4, 1, np.int16)
+    buffer.write(make_block(0, 6))
+    first_segment = buffer._segments[0]
+
+    buffer.reserve()
+
+    assert buffer.capacity == 12
+    assert buffer._segments[0] is first_segment
+    assert buffer.write(make_block(6, 4))
+    assert np.array_equal(buffer.frames()[:, 0], np.arange(10, dtype=np.int16))
+
+
+def test_empty_range():
+    """Nothing written reads back as an empty array of the right shape."""
+    buffer = AudioCaptureBuffer(4, 2, np.int16)
+    assert buffer.frames().shape == (0, 2)
+
+
+def test_invalid_segment_size_rejected():
+    """Zero segment size raises ValueError."""
+    with pytest.raises(ValueError):
+        AudioCaptureBuffer(0, 1, np.int16)
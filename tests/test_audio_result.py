@@ -0,0 +1,51 @@
+"""Tests for AudioResult hierarchy."""
+
+import numpy as np
+import pytest
+from audio_source import AudioResult, AudioDataResult, AudioFileResult, AudioTextResult, AudioPendingTextResult
+
+
+def test_results_carry_discriminator_and_fields():
+    """Each result type sets its discriminator and payload."""
+    audio = np.zeros(4, dtype=np.int16)
+
+    data_result = AudioDataResult(audio, 16000)
+    file_result = AudioFileResult("/tmp/a.wav", 16000)
+    text_result = AudioTextResult("hello", 16000, audio_data=audio)
+
+    assert (data_result.result_type, data_result.audio_data is audio) == ("audio_data", True)
+    assert (file_result.result_type, file_result.file_path) == ("audio_file", "/tmp/a.wav")
+    assert (text_result.result_type, text_result.transcribed_text) == ("audio_text", "hello")
+    assert text_result.sample_rate == 16000
+
+
+@pytest.mark.parametrize("result", [
+    AudioResult("audio_data", 16000),
+    AudioDataResult(np.zeros(1, dtype=np.int16), 16000),
+    AudioFileResult("/tmp/a.wav", 16000),
+    AudioTextResult("hello", 16000),
+    AudioPendingTextResult(np.zeros(1, dtype=np.int16), 16000, lambda audio: None),
+])
+def test_results_use_slots(result):
+    """Results have no per-instance __dict__."""
+    assert not hasattr(result, '__dict__')
+    with pytest.raises(AttributeError):
+        result.unexpected = True
+
+
+def test_pending_result_transcribes_on_demand():
+    """Transcriber runs only when transcribe() is called, with the captured audio."""
+    audio = np.zeros(4, dtype=np.int16)
+    calls = []
+
+    def transcriber(audio_data):
+        calls.append(audio_data)
+        return AudioTextResult("<tx>hi</tx>", 16000, audio_data=audio_data)
+
+    pending = AudioPendingTextResult(audio, 16000, transcriber)
+    assert pending.result_type == "audio_pending_text"
+    assert calls == []
+
+    result = pending.transcribe()
+    assert calls[0] is audio
+    assert result.transcribed_text == "<tx>hi</tx>"
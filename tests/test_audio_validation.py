@@ -167,6 +167,23 @@ def test_validation_with_intermittent_peaks():
     assert audio_source._validate_recording(audio_data) is True
 
 
+def test_validation_detects_sustained_peak_at_end_of_long_recording():
+    """Sliding RMS covers the final window of a long recording."""
+    config = MockConfig()
+    audio_source = create_audio_source(config)
+    audio_source.recording_start_time = time.time() - 30.0
+
+    sample_rate = 16000
+    audio_data = np.zeros(30 * sample_rate, dtype=np.int16)
+    audio_data[-sample_rate // 2:] = 3000
+
+    assert audio_source._validate_recording(audio_data) is True
+
+    audio_data[-sample_rate // 2:] = 0
+    audio_data[-1] = 3000
+    assert audio_source._validate_recording(audio_data) is False
+
+
 def test_validation_handles_float32_audio():
     """Validation correctly handles float32 audio with normalized values."""
     config = MockConfig()
@@ -292,6 +309,17 @@ def test_validation_works_with_float64_audio():
     assert audio_source._validate_recording(audio_data) is True
 
 
+def test_validation_counts_full_scale_negative_peak():
+    """A -32768 sample registers as full-scale, not as a wrapped negative value."""
+    config = MockConfig()
+    audio_source = create_audio_source(config)
+    audio_source.recording_start_time = time.time() - 1.5
+
+    audio_data = np.full(16000, -32768, dtype=np.int16)
+
+    assert audio_source._validate_recording(audio_data) is True
+
+
 if __name__ == "__main__":
     test_validation_passes_with_valid_recording()
     test_validation_rejects_too_short_duration()
@@ -309,4 +337,5 @@ if __name__ == "__main__":
     test_validation_works_with_uint8_audio()
     test_validation_works_with_int32_audio()
     test_validation_works_with_float64_audio()
+    test_validation_counts_full_scale_negative_peak()
     print("All audio validation tests passed")
@@ -0,0 +1,39 @@
+"""Tests for audio stream configuration options."""
+
+import sys
+import unittest
+from unittest.mock import patch
+from config_manager import ConfigManager
+
+
+class TestAudioStreamOptions(unittest.TestCase):
+    """Test audio blocksize and latency options."""
+
+    @patch('sys.argv', ['prog', '--model', 'gemini/gemini-2.5-flash'])
+    def test_defaults(self):
+        """Defaults favor fewer, larger callbacks."""
+        config = ConfigManager()
+        self.assertTrue(config.parse_configuration())
+        self.assertEqual(config.audio_blocksize, 2048)
+        self.assertEqual(config.audio_latency, 'low')
+        self.assertEqual(config.audio_encoding, 'pcm16')
+
+    @patch('sys.argv', ['prog', '--model', 'gemini/gemini-2.5-flash', '--audio-encoding', 'ulaw'])
+    def test_ulaw_encoding_opt_in(self):
+        """Mu-law upload encoding is selected explicitly."""
+        config = ConfigManager()
+        self.assertTrue(config.parse_configuration())
+        self.assertEqual(config.audio_encoding, 'ulaw')
+
+    @patch('sys.argv', ['prog', '--model', 'gemini/gemini-2.5-flash',
+                        '--audio-blocksize', '512', '--audio-latency', 'high'])
+    def test_cli_overrides(self):
+        """CLI flags override stream buffering defaults."""
+        config = ConfigManager()
+        self.assertTrue(config.parse_configuration())
+        self.assertEqual(config.audio_blocksize, 512)
+        self.assertEqual(config.audio_latency, 'high')
+
+
+if __name__ == '__main__':
+    unittest.main()
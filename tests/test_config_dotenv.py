@@ -0,0 +1,50 @@
+"""Tests for cached .env loading in ConfigManager."""
+
+from unittest.mock import patch
+import dotenv
+import config_manager
+
+
+def test_dotenv_parsed_once_per_path(tmp_path, monkeypatch):
+    """Second load reuses parsed values and still applies them to the environment."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("QS_TEST_DOTENV_VALUE=from_file\n")
+    monkeypatch.delenv("QS_TEST_DOTENV_VALUE", raising=False)
+    monkeypatch.setattr(config_manager, "_dotenv_cache", {})
+
+    with patch.object(dotenv, "dotenv_values", wraps=dotenv.dotenv_values) as parse:
+        config_manager._load_dotenv_cached(str(env_file), str(tmp_path / ".env.py"))
+        monkeypatch.delenv("QS_TEST_DOTENV_VALUE")
+        config_manager._load_dotenv_cached(str(env_file), str(tmp_path / ".env.py"))
+
+    assert parse.call_count == 1
+    assert config_manager.os.environ["QS_TEST_DOTENV_VALUE"] == "from_file"
+
+
+def test_existing_environment_not_overridden(tmp_path, monkeypatch):
+    """Variables already set take precedence over .env values."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("QS_TEST_DOTENV_VALUE=from_file\n")
+    monkeypatch.setenv("QS_TEST_DOTENV_VALUE", "from_env")
+    monkeypatch.setattr(config_manager, "_dotenv_cache", {})
+
+    config_manager._load_dotenv_cached(str(env_file), str(tmp_path / ".env.py"))
+
+    assert config_manager.os.environ["QS_TEST_DOTENV_VALUE"] == "from_env"
+
+
+def test_env_module_preferred_over_dotenv(tmp_path, monkeypatch):
+    """ENV dict from .env.py is applied instead of parsing .env."""
+    (tmp_path / ".env").write_text("QS_TEST_DOTENV_VALUE=from_file\n")
+    env_module = tmp_path / ".env.py"
+    env_module.write_text("ENV = {'QS_TEST_DOTENV_VALUE': 'from_module', 'QS_TEST_DOTENV_NUMBER': 3}\n")
+    monkeypatch.delenv("QS_TEST_DOTENV_VALUE", raising=False)
+    monkeypatch.delenv("QS_TEST_DOTENV_NUMBER", raising=False)
+    monkeypatch.setattr(config_manager, "_dotenv_cache", {})
+
+    with patch.object(dotenv, "dotenv_values") as parse:
+        config_manager._load_dotenv_cached(str(tmp_path / ".env"), str(env_module))
+
+    parse.assert_not_called()
+    assert config_manager.os.environ["QS_TEST_DOTENV_VALUE"] == "from_module"
+    assert config_manager.os.environ["QS_TEST_DOTENV_NUMBER"] == "3"
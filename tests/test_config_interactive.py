@@ -0,0 +1,58 @@
+"""Tests for ConfigManager interactive prompts."""
+
+import io
+from unittest.mock import patch
+from config_manager import ConfigManager
+
+
+def test_interactive_model_read_from_stdin():
+    """Model entered at the prompt is stripped and accepted."""
+    config = ConfigManager()
+    with patch('sys.stdin', io.StringIO("  gemini/gemini-2.5-flash \n")):
+        assert config.handle_interactive_mode() is True
+    assert config.model_id == "gemini/gemini-2.5-flash"
+
+
+def test_interactive_malformed_model_rejected():
+    """Model without provider prefix is rejected."""
+    config = ConfigManager()
+    with patch('sys.stdin', io.StringIO("gpt-4\n")):
+        assert config.handle_interactive_mode() is False
+
+
+def test_select_from_list_retries_until_valid():
+    """Invalid entries are re-prompted; valid number selects option."""
+    config = ConfigManager()
+    with patch('sys.stdin', io.StringIO("abc\n5\n2\n")):
+        assert config.select_from_list(["a", "b", "c"], "Pick:") == "b"
+
+
+def test_select_from_list_end_of_input_cancels():
+    """End of input cancels selection like input() raising EOFError."""
+    config = ConfigManager()
+    with patch('sys.stdin', io.StringIO("")):
+        assert config.select_from_list(["a"], "Pick:") is None
+
+
+def test_terminal_prompt_uses_input():
+    """Terminal stdin goes through input() so readline editing applies."""
+    config = ConfigManager()
+    with patch('sys.stdin') as stdin, patch('builtins.input', return_value="openai/gpt-4") as prompt:
+        stdin.isatty.return_value = True
+        assert config.handle_interactive_mode() is True
+    prompt.assert_called_once_with("Model: ")
+    assert config.model_id == "openai/gpt-4"
+
+
+@patch('sys.argv', ['prog'])
+@patch('instruction_composer.InstructionComposer')
+def test_interactive_parse_skips_instruction_composer(mock_composer_class):
+    """Without CLI arguments the mode list is not discovered."""
+    config = ConfigManager()
+    with patch('sys.stdin', io.StringIO("gemini/gemini-2.5-flash\n")), \
+            patch.dict('os.environ', {}, clear=False) as env:
+        env.pop('QUICKSCRIBE_MODEL', None)
+        assert config.parse_configuration() is True
+    mock_composer_class.assert_not_called()
+    assert config.model_id == "gemini/gemini-2.5-flash"
+    assert config.mode == 'dictate'
@@ -5,6 +5,7 @@ import unittest
 import sys
 from unittest.mock import Mock, MagicMock, patch
 from config_manager import ConfigManager
+from instruction_composer import InstructionComposer
 
 
 class TestDynamicModeChoices(unittest.TestCase):
@@ -141,5 +142,57 @@ class TestModeHelpText(unittest.TestCase):
         self.assertIn('shell', mode_action.help)
 
 
+class TestParserCaching(unittest.TestCase):
+    """Test argument parser reuse."""
+
+    def test_parser_reused_for_same_modes(self):
+        """Repeated setup with unchanged modes returns the same parser."""
+        config_manager = ConfigManager()
+
+        mock_composer = Mock()
+        mock_composer.get_available_modes.return_value = ['dictate', 'edit']
+
+        first = config_manager.setup_argument_parser(mock_composer)
+        second = config_manager.setup_argument_parser(mock_composer)
+
+        self.assertIs(first, second)
+
+    def test_parser_shared_across_instances(self):
+        """A new ConfigManager reuses the parser built by another instance."""
+        mock_composer = Mock()
+        mock_composer.get_available_modes.return_value = ['dictate', 'edit']
+
+        first = ConfigManager().setup_argument_parser(mock_composer)
+        second = ConfigManager().setup_argument_parser(mock_composer)
+
+        self.assertIs(first, second)
+
+    def test_parser_rebuilt_when_modes_change(self):
+        """Changed mode list produces a parser with the new choices."""
+        config_manager = ConfigManager()
+
+        mock_composer = Mock()
+        mock_composer.get_available_modes.return_value = ['dictate']
+        first = config_manager.setup_argument_parser(mock_composer)
+
+        mock_composer.get_available_modes.return_value = ['dictate', 'shell']
+        second = config_manager.setup_argument_parser(mock_composer)
+
+        self.assertIsNot(first, second)
+        mode_action = next(a for a in second._actions if '--mode' in a.option_strings)
+        self.assertEqual(mode_action.choices, ['dictate', 'shell'])
+
+    @patch('sys.argv', ['prog', '--model', 'gemini/gemini-2.5-flash'])
+    def test_parsed_args_reused_for_same_argv(self):
+        """Repeated configuration parse with the same argv parses once."""
+        config_manager = ConfigManager()
+        self.assertTrue(config_manager.parse_configuration())
+
+        parser = config_manager.setup_argument_parser(InstructionComposer())
+        with patch.object(parser, 'parse_args', wraps=parser.parse_args) as parse_args:
+            self.assertTrue(config_manager.parse_configuration())
+            parse_args.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
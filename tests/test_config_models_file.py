@@ -0,0 +1,20 @@
+"""Tests for ConfigManager.load_models_from_file."""
+
+from config_manager import ConfigManager
+
+
+def test_blank_lines_and_whitespace_stripped(tmp_path):
+    """Model names are stripped and blank lines skipped."""
+    models_file = tmp_path / "models.txt"
+    models_file.write_text("gemini/gemini-2.5-flash\n\n  openai/gpt-4  \n\t\nlast/model")
+
+    models = ConfigManager().load_models_from_file(str(models_file))
+
+    assert models == ["gemini/gemini-2.5-flash", "openai/gpt-4", "last/model"]
+
+
+def test_missing_file_returns_empty_list(tmp_path):
+    """Missing file reports an error and yields no models."""
+    models = ConfigManager().load_models_from_file(str(tmp_path / "absent.txt"))
+
+    assert models == []
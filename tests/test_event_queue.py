@@ -0,0 +1,69 @@
+"""Tests for EventQueue sequential worker."""
+
+import threading
+from lib.event_queue import EventQueue
+
+
+def test_items_processed_in_order():
+    """Items enqueued from the caller thread are processed in FIFO order."""
+    processed = []
+    done = threading.Event()
+
+    def processor(item):
+        processed.append(item)
+        if item == 4:
+            done.set()
+
+    event_queue = EventQueue(processor, name="OrderTest")
+    event_queue.start()
+    try:
+        for i in range(5):
+            event_queue.enqueue(i)
+        assert done.wait(timeout=2.0)
+        assert processed == [0, 1, 2, 3, 4]
+    finally:
+        event_queue.shutdown()
+
+
+def test_enqueue_during_processing_is_not_delayed():
+    """Item enqueued while the worker is busy is picked up without waiting for the idle timeout."""
+    second_done = threading.Event()
+    first_started = threading.Event()
+    release_first = threading.Event()
+
+    def processor(item):
+        if item == "first":
+            first_started.set()
+            release_first.wait(timeout=2.0)
+        else:
+            second_done.set()
+
+    event_queue = EventQueue(processor, name="WakeTest")
+    event_queue.start()
+    try:
+        event_queue.enqueue("first")
+        assert first_started.wait(timeout=2.0)
+        event_queue.enqueue("second")
+        release_first.set()
+        assert second_done.wait(timeout=0.5)
+    finally:
+        event_queue.shutdown()
+
+
+def test_processor_error_does_not_stop_worker():
+    """Exception from one item is logged and later items still run."""
+    done = threading.Event()
+
+    def processor(item):
+        if item == "bad":
+            raise RuntimeError("boom")
+        done.set()
+
+    event_queue = EventQueue(processor, name="ErrorTest")
+    event_queue.start()
+    try:
+        event_queue.enqueue("bad")
+        event_queue.enqueue("good")
+        assert done.wait(timeout=2.0)
+    finally:
+        event_queue.shutdown()
@@ -172,5 +172,46 @@ class TestIncrementalStreaming(unittest.TestCase):
         self.assertEqual(self.keyboard.output, "Word")
 
 
+    def test_mode_tag_split_across_chunks(self):
+        """A <mode> tag completed by a later chunk switches mode and drops the buffer."""
+        self.service.processor.reset({})
+        self.service.config.mode = 'dictate'
+        self.service.composer = Mock()
+        self.service.composer.get_available_modes.return_value = ['dictate', 'edit']
+
+        self.service.process_streaming_chunk('<mode>ed')
+        self.assertEqual(self.service.config.mode, 'dictate')
+        self.assertEqual(self.service.streaming_buffer, '<mode>ed')
+
+        self.service.process_streaming_chunk('it</mode>')
+        self.assertEqual(self.service.config.mode, 'edit')
+        self.assertEqual(self.service.streaming_buffer, '')
+
+    def test_same_mode_handled_once_per_stream(self):
+        """A <mode> tag naming the current mode is not re-handled on later chunks."""
+        self.service.processor.reset({})
+        self.service.config.mode = 'dictate'
+        self.service.composer = Mock()
+        self.service.composer.get_available_modes.return_value = ['dictate', 'edit']
+
+        with patch.object(self.service, '_handle_mode_change', wraps=self.service._handle_mode_change) as handle:
+            self.service.process_streaming_chunk('<mode>dictate</mode>')
+            self.service.process_streaming_chunk('<update><10>Hi </10>')
+            self.service.process_streaming_chunk('<20>there</20></update>')
+
+        handle.assert_called_once_with('dictate')
+        self.assertEqual(self.keyboard.output, "Hi there")
+
+    def test_tags_split_at_chunk_boundaries(self):
+        """Update and reset tags are found when cut across chunks."""
+        self.service.processor.reset({})
+
+        for chunk in ['<up', 'date><10>Old </10><re', 'set/>', '<upd', 'ate><10>New </10></upd', 'ate>']:
+            self.service.process_streaming_chunk(chunk)
+
+        self.assertEqual(self.service.processor.current_words, {10: "New "})
+        self.assertEqual(self.keyboard.output, "Old New ")
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
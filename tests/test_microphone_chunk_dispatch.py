@@ -0,0 +1,145 @@
+"""Tests for delivering microphone chunks to handlers off the audio callback."""
+
+import threading
+import numpy as np
+from unittest.mock import Mock, patch
+from microphone_audio_source import MicrophoneAudioSource
+from lib.audio_capture_buffer import AudioCaptureBuffer
+
+
+class RecordingHandler:
+    """Chunk handler that records batches and the thread they arrive on."""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def on_chunk(self, chunk, timestamp):
+        self.batches.append(chunk.copy())
+        self.threads.add(threading.current_thread().name)
+
+
+def _started_source(handler, batch_frames):
+    """Source in the state start_recording leaves it, without opening a stream."""
+    config = Mock(sample_rate=16000, channels=1)
+    source = MicrophoneAudioSource(config, chunk_handler=handler)
+    source.audio_buffer = AudioCaptureBuffer(64, 1, np.int16)
+    source._chunk_batch_frames = batch_frames
+    source._start_capture_worker()
+    source._recording.set()
+    return source
+
+
+def test_batches_delivered_on_capture_worker():
+    """Handler runs on the capture worker, in batch-sized pieces, not on the callback caller."""
+    handler = RecordingHandler()
+    source = _started_source(handler, batch_frames=8)
+
+    for value in range(4):
+        source.audio_callback(np.full((4, 1), value, dtype=np.int16), 4, None, None)
+    source._stop_capture_worker()
+    source._capture_pool.shutdown()
+
+    assert handler.threads == {"AudioCapture-0"}
+    assert [batch[:, 0].tolist() for batch in handler.batches] == [
+        [0, 0, 0, 0, 1, 1, 1, 1],
+        [2, 2, 2, 2, 3, 3, 3, 3],
+    ]
+
+
+def test_callback_only_stores_frames():
+    """The audio callback neither calls the handler nor grows storage."""
+    handler = RecordingHandler()
+    config = Mock(sample_rate=16000, channels=1)
+    source = MicrophoneAudioSource(config, chunk_handler=handler)
+    source.audio_buffer = AudioCaptureBuffer(4, 1, np.int16)
+    source._chunk_batch_frames = 2
+    source._recording.set()
+
+    for value in range(3):
+        source.audio_callback(np.full((4, 1), value, dtype=np.int16), 4, None, None)
+
+    assert handler.batches == []
+    assert source.audio_buffer.capacity == 8
+    assert source.audio_buffer.frames_written == 8
+    assert source.audio_buffer.dropped_blocks == 1
+
+
+def test_partial_batch_handled_before_stop_returns():
+    """Stopping the worker waits for the final partial batch."""
+    handler = RecordingHandler()
+    source = _started_source(handler, batch_frames=100)
+
+    source.audio_callback(np.ones((3, 1), dtype=np.int16), 3, None, None)
+    source._stop_capture_worker()
+
+    assert len(handler.batches) == 1
+    assert len(handler.batches[0]) == 3
+    assert source._capture_stop is None
+    source._capture_pool.shutdown()
+
+
+def test_capture_worker_reused_across_recordings():
+    """One long-lived worker serves consecutive recordings."""
+    handler = RecordingHandler()
+    source = _started_source(handler, batch_frames=100)
+    source._stop_capture_worker()
+    pool = source._capture_pool
+
+    source.audio_buffer = AudioCaptureBuffer(64, 1, np.int16)
+    source._start_capture_worker()
+    source.audio_callback(np.ones((3, 1), dtype=np.int16), 3, None, None)
+    source._stop_capture_worker()
+
+    assert source._capture_pool is pool
+    assert handler.threads == {"AudioCapture-0"}
+    pool.shutdown()
+
+
+def test_capture_worker_runs_at_background_priority():
+    """The capture worker lowers its own scheduling class before handling batches."""
+    handler = RecordingHandler()
+    calls = []
+    with patch('microphone_audio_source.set_background_qos',
+               side_effect=lambda: calls.append(threading.current_thread().name)):
+        source = _started_source(handler, batch_frames=100)
+        source._stop_capture_worker()
+    source._capture_pool.shutdown()
+
+    assert calls == ["AudioCapture-0"]
+
+
+def test_capture_storage_sized_from_previous_recording():
+    """A recording longer than one segment makes the next recording's segments that long."""
+    config = Mock(sample_rate=10, channels=1, chunk_batch_ms=100, audio_blocksize=0)
+    source = MicrophoneAudioSource(config)
+    with patch('microphone_audio_source.sd'):
+        source.start_recording()
+        assert source.audio_buffer.segment_frames == source.BUFFER_SEGMENT_SECONDS * 10
+        for _ in range(5):
+            source.audio_buffer.reserve()
+            source.audio_buffer.write(np.zeros((100, 1), dtype=np.int16))
+        source._recording.clear()
+        source._stop_capture_worker()
+
+        source.start_recording()
+        source._recording.clear()
+        source._stop_capture_worker()
+
+    assert source.audio_buffer.segment_frames == 500
+    source._capture_pool.shutdown()
+
+
+def test_streaming_blocksize_capped_at_batch_size():
+    """Streaming handlers get blocks no larger than one batch; batch capture keeps large blocks."""
+    config = Mock(sample_rate=16000, channels=1, audio_blocksize=2048)
+    streaming = MicrophoneAudioSource(config, chunk_handler=RecordingHandler())
+    streaming._chunk_batch_frames = 1600
+    batch_only = MicrophoneAudioSource(config)
+    batch_only._chunk_batch_frames = 1600
+
+    assert streaming._stream_blocksize() == 1600
+    assert batch_only._stream_blocksize() == 2048
+
+    streaming._chunk_batch_frames = 0
+    assert streaming._stream_blocksize() == 2048
@@ -30,7 +30,7 @@ sys.modules['PyQt6.QtGui'] = mock_qt.QtGui
 from dictation_app import DictationApp
 from recording_session import RecordingSession, RecordingSource
 from processing_session import ProcessingSession
-from audio_source import AudioDataResult, AudioTextResult
+from audio_source import AudioDataResult, AudioTextResult, AudioPendingTextResult
 from providers.conversation_context import ConversationContext
 from model_invocation_worker import invoke_model_for_session
 from session_output_worker import process_session_output
@@ -187,6 +187,35 @@ class TestParallelModelInvocation(unittest.TestCase):
 
         app.processing_coordinator.shutdown()
 
+    def test_pending_transcription_runs_in_worker(self):
+        """Deferred transcription text is what the model receives."""
+        mock_provider = MockProvider()
+        result = AudioPendingTextResult(
+            [0] * 4, 16000, lambda audio: AudioTextResult("<tx>hello</tx>", 16000)
+        )
+        context = ConversationContext(xml_markup="", compiled_text="", sample_rate=16000)
+        session = ProcessingSession(RecordingSession(RecordingSource.KEYBOARD), context, result)
+
+        invoke_model_for_session(mock_provider, session, result)
+
+        self.assertTrue(session.chunks_complete.is_set())
+        self.assertEqual(mock_provider.transcribe_calls[0]['text_data'], "<tx>hello</tx>")
+
+    def test_empty_pending_transcription_skips_model(self):
+        """Empty deferred transcription completes the session without a model call."""
+        mock_provider = MockProvider()
+        result = AudioPendingTextResult(
+            [0] * 4, 16000, lambda audio: AudioTextResult("", 16000)
+        )
+        context = ConversationContext(xml_markup="", compiled_text="", sample_rate=16000)
+        session = ProcessingSession(RecordingSession(RecordingSource.KEYBOARD), context, result)
+
+        invoke_model_for_session(mock_provider, session, result)
+
+        self.assertTrue(session.chunks_complete.is_set())
+        self.assertTrue(session.is_empty)
+        self.assertEqual(mock_provider.call_count, 0)
+
 
 class TestSequentialOutput(unittest.TestCase):
     """Test sequential keyboard output processing."""
@@ -189,6 +189,70 @@ class TestPersistentState(unittest.TestCase):
         expected = {10: "New ", 20: "content "}
         self.assertEqual(service.processor.current_words, expected)
 
+    def test_reset_command_removed_case_insensitively(self):
+        """Test that detected reset phrases are stripped regardless of case."""
+        class MockConfig:
+            debug_enabled = False
+            xml_stream_debug = False
+        service = TranscriptionService(MockConfig())
+        service.processor.reset({10: "Initial "})
+
+        cleaned = service.detect_and_execute_commands("OK, Start Over please")
+
+        self.assertEqual(cleaned, "OK,  please")
+        self.assertEqual(service.processor.current_words, {})
+        self.assertEqual(service.detect_and_execute_commands("Keep going"), "Keep going")
+
+    def test_only_matched_reset_command_removed(self):
+        """Test that only the detected reset phrase is stripped, not later repeats."""
+        class MockConfig:
+            debug_enabled = False
+            xml_stream_debug = False
+        service = TranscriptionService(MockConfig())
+
+        cleaned = service.detect_and_execute_commands("start over and start over again")
+
+        self.assertEqual(cleaned, "and start over again")
+
+    def test_tagless_transcription_leaves_words_unchanged(self):
+        """Test that empty or tag-free text only finishes the stream."""
+        class MockConfig:
+            debug_enabled = False
+            xml_stream_debug = False
+        service = TranscriptionService(MockConfig())
+        keyboard = MockKeyboardInjector()
+        service.keyboard = keyboard
+        service.processor.keyboard = keyboard
+        service.processor.reset({10: "Hello"})
+
+        service.process_xml_transcription("")
+        service.process_xml_transcription("   ")
+
+        self.assertEqual(service.processor.current_words, {10: "Hello "})
+        self.assertEqual(keyboard.output, "")
+
+    def test_context_strings_cached_until_words_change(self):
+        """Context XML/text are rebuilt only after the processor's words change."""
+        class MockConfig:
+            debug_enabled = False
+            xml_stream_debug = False
+        service = TranscriptionService(MockConfig())
+        keyboard = MockKeyboardInjector()
+        service.keyboard = keyboard
+        service.processor.keyboard = keyboard
+
+        service.process_xml_transcription('<10>Hello </10><20>world</20>')
+        first_xml = service._build_xml_from_processor()
+        self.assertIs(service._build_xml_from_processor(), first_xml)
+        self.assertIs(service._build_current_text(), service._build_current_text())
+
+        service.process_xml_transcription('<30>again</30>')
+        self.assertEqual(service._build_xml_from_processor(), first_xml + '<30>again </30>')
+        self.assertEqual(service._build_current_text(), "Hello world again ")
+
+        service.processor.current_words = {10: "Replaced "}
+        self.assertEqual(service._build_current_text(), "Replaced ")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""Tests for ProcessingSession chunk stream completion."""
+
+import threading
+from unittest.mock import Mock, patch
+from processing_session import ProcessingSession, END_OF_CHUNKS
+from session_output_worker import process_session_output
+
+
+def make_session():
+    """Create a session with placeholder recording, context, and result."""
+    return ProcessingSession(Mock(), Mock(), Mock())
+
+
+def test_completion_enqueues_single_end_marker():
+    """Setting chunks_complete queues END_OF_CHUNKS after pending chunks, once."""
+    session = make_session()
+    session.chunk_queue.put("a")
+
+    session.chunks_complete.set()
+    session.chunks_complete.set()
+
+    assert session.chunks_complete.is_set()
+    assert session.chunk_queue.get_nowait() == "a"
+    assert session.chunk_queue.get_nowait() is END_OF_CHUNKS
+    assert session.chunk_queue.empty()
+
+
+def test_concurrent_completion_enqueues_single_end_marker():
+    """Threads completing the stream at the same time still queue one END_OF_CHUNKS."""
+    import time
+    session = make_session()
+    event = session.chunks_complete
+    is_set = event.is_set
+
+    def slow_is_set():
+        # Widen the window between checking and setting
+        result = is_set()
+        time.sleep(0.01)
+        return result
+
+    event.is_set = slow_is_set
+    barrier = threading.Barrier(4)
+
+    def complete():
+        barrier.wait()
+        session.chunks_complete.set()
+
+    threads = [threading.Thread(target=complete) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert session.chunk_queue.get_nowait() is END_OF_CHUNKS
+    assert session.chunk_queue.empty()
+
+
+def test_output_worker_finishes_when_stream_completes():
+    """Output worker processes chunks in order and returns promptly on completion."""
+    session = make_session()
+    app = Mock()
+    app.config.reset_state_each_response = False
+    app.transcription_service._build_current_text.return_value = ""
+    processed = []
+    app.transcription_service.process_streaming_chunk.side_effect = processed.append
+
+    worker = threading.Thread(target=process_session_output, args=(app, session))
+    worker.start()
+    session.chunk_queue.put("chunk1")
+    session.chunk_queue.put("chunk2")
+    session.chunks_complete.set()
+    worker.join(timeout=1.0)
+
+    assert not worker.is_alive()
+    assert processed == ["chunk1", "chunk2"]
+    app.transcription_service.complete_stream.assert_called_once()
+
+
+def test_output_worker_returns_to_idle_for_empty_session():
+    """Empty transcription produces no output and returns the app to idle."""
+    session = make_session()
+    session.is_empty = True
+    session.chunks_complete.set()
+    app = Mock()
+
+    with patch('session_output_worker.pr_info') as pr_info:
+        process_session_output(app, session)
+
+    app._return_to_idle.assert_called_once()
+    app.transcription_service.complete_stream.assert_not_called()
+    app.transcription_service.reset_all_state.assert_not_called()
+    pr_info.assert_not_called()
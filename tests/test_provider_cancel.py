@@ -0,0 +1,53 @@
+"""Tests for cancelling in-flight provider streams."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from config_manager import ConfigManager
+from providers.base_provider import BaseProvider
+
+
+def _chunk(text):
+    """Build a streaming chunk carrying text content."""
+    delta = SimpleNamespace(content=text, reasoning_content=None, thinking_blocks=None)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+
+class TestProviderCancel(unittest.TestCase):
+    """cancel() stops streams that are already running."""
+
+    def setUp(self):
+        """Create a provider without a live LiteLLM client."""
+        with patch('sys.argv', ['test', '--model', 'gemini/gemini-2.5-flash']):
+            self.config = ConfigManager()
+            self.assertTrue(self.config.parse_configuration())
+        self.provider = BaseProvider(self.config, MagicMock())
+
+    def test_cancel_stops_stream_at_next_chunk(self):
+        """Chunks arriving after cancel() are not forwarded."""
+        received = []
+
+        def response():
+            yield _chunk("<xml>")
+            self.provider.cancel()
+            yield _chunk("<10>late")
+            yield _chunk("</10></xml>")
+
+        self.provider._process_streaming_response(response(), received.append)
+
+        self.assertEqual(received, ["<xml>"])
+
+    def test_cancel_does_not_affect_later_streams(self):
+        """A stream started after cancel() runs to completion."""
+        self.provider.cancel()
+        received = []
+
+        self.provider._process_streaming_response(
+            iter([_chunk("<xml>"), _chunk("</xml>")]), received.append
+        )
+
+        self.assertEqual(received, ["<xml>", "</xml>"])
+
+
+if __name__ == '__main__':
+    unittest.main()
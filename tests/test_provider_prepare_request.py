@@ -0,0 +1,102 @@
+"""Tests for composing provider instructions ahead of a request."""
+
+import types
+import numpy as np
+import unittest
+from unittest.mock import MagicMock, patch
+from config_manager import ConfigManager
+from providers.base_provider import BaseProvider, MAX_INLINE_AUDIO_BYTES
+from providers.conversation_context import ConversationContext
+
+
+class TestPrepareRequest(unittest.TestCase):
+    """Instructions prepared at recording start are used by transcribe()."""
+
+    def setUp(self):
+        """Create a provider whose completion call is captured."""
+        with patch('sys.argv', ['test', '--model', 'gemini/gemini-2.5-flash']):
+            self.config = ConfigManager()
+            self.assertTrue(self.config.parse_configuration())
+        self.provider = BaseProvider(self.config, MagicMock())
+        self.provider._initialized = True
+        self.provider.litellm = MagicMock()
+        self.provider.litellm.completion.side_effect = RuntimeError("stop after request")
+        self.provider.litellm_exceptions = types.SimpleNamespace(
+            InternalServerError=type('InternalServerError', (Exception,), {})
+        )
+        self.context = ConversationContext("", "", 16000)
+
+    def _sent_instructions(self):
+        messages = self.provider.litellm.completion.call_args.kwargs['messages']
+        return messages[0]['content'][0]['text']
+
+    def test_prepared_instructions_reused(self):
+        """transcribe() does not recompose after prepare_request()."""
+        with patch.object(self.provider.instruction_composer, 'compose', return_value="PREPARED") as compose, \
+                patch.object(self.provider, '_handle_provider_error'):
+            self.provider.prepare_request()
+            self.provider.transcribe(self.context, text_data="hello")
+
+        compose.assert_called_once()
+        self.assertEqual(self._sent_instructions(), "PREPARED")
+
+    def test_mode_change_recomposes(self):
+        """Instructions prepared for another mode are not used."""
+        with patch.object(self.provider.instruction_composer, 'compose',
+                          side_effect=["OLD MODE", "NEW MODE"]) as compose, \
+                patch.object(self.provider, '_handle_provider_error'):
+            self.provider.prepare_request()
+            self.config.mode = 'shell'
+            self.provider.transcribe(self.context, text_data="hello")
+
+        self.assertEqual(compose.call_count, 2)
+        self.assertEqual(self._sent_instructions(), "NEW MODE")
+
+
+    def test_oversized_audio_rejected_before_encoding(self):
+        """Audio over the inline limit is dropped without encoding or a request."""
+        audio = np.zeros(MAX_INLINE_AUDIO_BYTES // 2, dtype=np.int16)
+        with patch.object(self.provider, '_encode_audio_to_base64') as encode:
+            self.provider.transcribe(self.context, audio_data=audio)
+
+        encode.assert_not_called()
+        self.provider.litellm.completion.assert_not_called()
+
+    def test_limit_applies_to_base64_size(self):
+        """Audio whose raw WAV fits but whose base64 encoding does not is dropped."""
+        audio = np.zeros(MAX_INLINE_AUDIO_BYTES * 5 // 12, dtype=np.int16)
+        with patch.object(self.provider, '_encode_audio_to_base64') as encode:
+            self.provider.transcribe(self.context, audio_data=audio)
+
+        encode.assert_not_called()
+        self.provider.litellm.completion.assert_not_called()
+
+    def test_static_params_reused_across_requests(self):
+        """Each request gets its own messages on top of the shared parameters."""
+        with patch.object(self.provider.instruction_composer, 'compose', return_value="PROMPT"), \
+                patch.object(self.provider, '_handle_provider_error'):
+            self.provider.transcribe(self.context, text_data="first")
+            self.provider.transcribe(self.context, text_data="second")
+
+        first, second = self.provider.litellm.completion.call_args_list
+        self.assertEqual(first.kwargs['model'], 'gemini/gemini-2.5-flash')
+        self.assertTrue(second.kwargs['stream'])
+        self.assertIn("second", second.kwargs['messages'][1]['content'])
+        self.assertNotIn('messages', self.provider._completion_params)
+
+    def test_audio_and_text_share_context_preamble(self):
+        """Audio and text requests open with the same conversation context."""
+        context = ConversationContext("<10>Hello </10>", "Hello", 16000)
+        with patch.object(self.provider.instruction_composer, 'compose', return_value="PROMPT"), \
+                patch.object(self.provider, '_encode_audio_to_base64', return_value="QUFB"), \
+                patch.object(self.provider, '_handle_provider_error'):
+            self.provider.transcribe(context, audio_data=np.zeros(16000, dtype=np.int16))
+            self.provider.transcribe(context, text_data="world")
+
+        audio_call, text_call = self.provider.litellm.completion.call_args_list
+        preamble = audio_call.kwargs['messages'][1]['content'][0]['text']
+        self.assertEqual(preamble, "Current conversation XML: <10>Hello </10>\nCurrent conversation text: Hello")
+        self.assertTrue(text_call.kwargs['messages'][1]['content'].startswith(preamble + "\n\nNEW INPUT"))
+
+if __name__ == '__main__':
+    unittest.main()
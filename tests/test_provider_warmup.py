@@ -0,0 +1,65 @@
+"""Tests for background provider connection warm-up."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from config_manager import ConfigManager
+from providers.base_provider import BaseProvider
+
+
+class TestConnectionWarmup(unittest.TestCase):
+    """Warm-up sends a minimal request and never raises."""
+
+    def setUp(self):
+        """Create a provider with a mocked LiteLLM module."""
+        with patch('sys.argv', ['test', '--model', 'gemini/gemini-2.5-flash']):
+            self.config = ConfigManager()
+            self.assertTrue(self.config.parse_configuration())
+        self.provider = BaseProvider(self.config, MagicMock())
+        self.provider.litellm = MagicMock()
+
+    def test_warm_connection_requests_single_token(self):
+        """One non-streaming completion capped at one token is sent."""
+        self.provider._warm_connection()
+
+        params = self.provider.litellm.completion.call_args.kwargs
+        self.assertEqual(params['model'], 'gemini/gemini-2.5-flash')
+        self.assertEqual(params['max_tokens'], 1)
+        self.assertFalse(params['stream'])
+
+    def test_warm_connection_failure_is_swallowed(self):
+        """Network or auth errors during warm-up are only logged."""
+        self.provider.litellm.completion.side_effect = RuntimeError("offline")
+
+        self.provider._warm_connection()
+
+    def _initialize_for_local_transcription(self):
+        """Run initialize() as with a local transcription source, returning the LiteLLM mock."""
+        self.config.audio_source = 'transcribe'
+        self.provider.mapper = MagicMock()
+        self.provider.mapper.uses_transcription_endpoint.return_value = False
+        litellm = MagicMock()
+        with patch.dict('sys.modules', {'litellm': litellm, 'litellm.exceptions': litellm.exceptions}), \
+                patch('providers.base_provider.threading.Thread') as thread:
+            self.assertTrue(self.provider.initialize())
+        return thread
+
+    def test_no_warm_up_by_default(self):
+        """Startup sends no request unless warm-up is enabled."""
+        self.assertFalse(self.config.warm_connection)
+
+        thread = self._initialize_for_local_transcription()
+
+        thread.assert_not_called()
+
+    def test_warm_up_when_enabled(self):
+        """--warm-connection starts the warm-up in the background."""
+        self.config.warm_connection = True
+
+        thread = self._initialize_for_local_transcription()
+
+        self.assertEqual(thread.call_args.kwargs['target'], self.provider._warm_connection)
+        thread.return_value.start.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
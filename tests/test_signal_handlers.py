@@ -15,6 +15,7 @@ sys.modules['PyQt6.QtGui'] = mock_qt.QtGui
 
 from dictation_app import DictationApp
 from config_manager import ConfigManager
+from recording_session import RecordingSource
 
 
 class TestSignalHandlers:
@@ -140,6 +141,101 @@ class TestSignalHandlers:
             assert any(call[0][0] == signal.SIGHUP for call in calls)
             assert any(call[0][0] == signal.SIGINT for call in calls)
 
+    def test_interrupt_sets_exit_event(self):
+        """Verify SIGINT channel wakes the main thread waiting without Qt."""
+        self.app.input_coordinator._handle_signal_channel("interrupt")
+
+        assert self.app.input_coordinator.exit_event.is_set()
+
+    def test_fallback_handlers_route_to_channels(self):
+        """Verify fallback handlers registered without Qt dispatch to signal channels."""
+        with patch('input_coordinator.signal.signal') as mock_signal:
+            self.app.input_coordinator.install_signal_handlers()
+
+        handlers = {call[0][0]: call[0][1] for call in mock_signal.call_args_list}
+        assert set(handlers) == {signal.SIGUSR1, signal.SIGUSR2, signal.SIGHUP, signal.SIGINT}
+
+        handlers[signal.SIGINT](signal.SIGINT, None)
+        assert self.app.input_coordinator.exit_event.wait(timeout=2.0)
+
+    def test_wait_for_exit_returns_when_listener_stops(self):
+        """Verify the main loop also ends when the keyboard listener thread exits."""
+        import threading
+        listener = threading.Thread(target=lambda: None)
+        listener.start()
+
+        with patch('input_coordinator.signal.signal'):
+            self.app.input_coordinator.wait_for_exit(listener)
+
+        assert self.app.input_coordinator.exit_event.is_set()
+
+    def test_key_events_handled_off_listener_thread_in_order(self):
+        """Verify listener callbacks hand key events to one worker, preserving order."""
+        import threading
+        coordinator = self.app.input_coordinator
+        coordinator.trigger_key = "trigger"
+        handled = []
+        coordinator.on_press = lambda key: handled.append(("press", key, threading.current_thread().name))
+        coordinator.on_release = lambda key: handled.append(("release", key, threading.current_thread().name))
+
+        with patch('input_coordinator.keyboard.Listener') as mock_listener:
+            coordinator.start_keyboard_listener()
+            callbacks = mock_listener.call_args.kwargs
+            callbacks['on_press']("trigger")
+            callbacks['on_release']("trigger")
+            coordinator.key_events.shutdown()
+
+        assert handled == [
+            ("press", "trigger", "KeyboardInput-0"),
+            ("release", "trigger", "KeyboardInput-0"),
+        ]
+
+    def test_non_trigger_releases_not_queued(self):
+        """Verify releases of other keys are dropped on the listener thread."""
+        coordinator = self.app.input_coordinator
+        coordinator.trigger_key = "trigger"
+        coordinator.on_release = Mock()
+
+        with patch('input_coordinator.keyboard.Listener') as mock_listener:
+            coordinator.start_keyboard_listener()
+            with patch.object(coordinator.key_events, 'submit') as submit:
+                mock_listener.call_args.kwargs['on_release']("a")
+            coordinator.key_events.shutdown()
+
+        submit.assert_not_called()
+
+    def test_other_key_press_aborts_keyboard_recording(self):
+        """Verify a non-trigger press during keyboard recording aborts and returns to idle."""
+        coordinator = self.app.input_coordinator
+        coordinator.trigger_key = "trigger"
+        recording = Mock()
+        recording.get_current_session.return_value.should_abort_on_keystroke.return_value = True
+        self.app.recording_coordinator = recording
+        self.app._return_to_idle = Mock()
+
+        coordinator.on_press("a")
+
+        recording.abort_recording.assert_called_once()
+        self.app._return_to_idle.assert_called_once()
+
+    def test_provider_requests_prepared_on_one_worker(self):
+        """Verify each recording hands request preparation to the same long-lived worker."""
+        import threading
+        recording = self.app.recording_coordinator
+        prepared_on = []
+        self.app.provider.prepare_request.side_effect = lambda: prepared_on.append(threading.current_thread())
+
+        for _ in range(2):
+            recording.start_recording(RecordingSource.KEYBOARD)
+            recording.abort_recording()
+        pool = recording._prepare_pool
+        recording.shutdown()
+
+        assert len(prepared_on) == 2
+        assert prepared_on[0] is prepared_on[1]
+        assert prepared_on[0].name == "PrepareRequest-0"
+        assert recording._prepare_pool is pool
+
     def test_mode_transition_resets_processor(self):
         """Verify mode transition triggers processor reset via existing mechanism."""
         self.app.transcription_service._handle_mode_change.return_value = True
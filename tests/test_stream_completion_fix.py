@@ -110,5 +110,18 @@ class TestStreamCompletionFix(unittest.TestCase):
         self.assertEqual(self.keyboard.output, "A fast brown fox ")
 
 
+    def test_complete_stream_waits_for_typing(self):
+        """The stream is complete only after the injector has typed everything flushed."""
+        events = []
+        self.keyboard.flush = lambda: events.append("flush")
+        self.keyboard.wait_until_typed = lambda timeout=None: events.append("wait") or True
+
+        self.service.process_streaming_chunk("<update><10>Hi</10></update>")
+        self.service.complete_stream()
+
+        self.assertEqual(events[-1], "wait")
+        self.assertIn("flush", events)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
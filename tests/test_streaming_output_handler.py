@@ -126,6 +126,30 @@ class TestStreamingOutputHandler(unittest.TestCase):
         calls = mock_print.call_args_list
         self.assertEqual(calls[-1], call(flush=True))
 
+    @patch('builtins.print')
+    def test_buffered_write_coalesces_until_interval(self, mock_print):
+        """Buffered writes within the interval print once, on exit."""
+        with get_streaming_handler(flush_interval=60.0) as stream:
+            stream.write("Hello")
+            stream.write(" World")
+            self.assertEqual(mock_print.call_count, 0)
+
+        calls = mock_print.call_args_list
+        self.assertEqual(calls[0], call(f"{Fore.WHITE}Hello World{Style.RESET_ALL}", end='', flush=True))
+        self.assertEqual(calls[1], call(flush=True))
+
+    @patch('builtins.print')
+    def test_buffered_write_prints_when_interval_elapsed(self, mock_print):
+        """Pending text prints as soon as the interval has passed."""
+        with patch('lib.pr_log.time.monotonic', side_effect=[0.0, 0.01, 0.2, 0.2, 0.3]):
+            with get_streaming_handler(flush_interval=0.1) as stream:
+                stream.write("a")
+                stream.write("b")
+
+        calls = mock_print.call_args_list
+        self.assertEqual(calls[0], call(f"{Fore.WHITE}ab{Style.RESET_ALL}", end='', flush=True))
+        self.assertEqual(calls[1], call(flush=True))
+
     @patch('builtins.print')
     def test_common_prefix_length_calculation(self, mock_print):
         """Test _common_prefix_length helper method."""
@@ -139,6 +163,19 @@ class TestStreamingOutputHandler(unittest.TestCase):
         self.assertEqual(handler._common_prefix_length("test", "testing"), 4)
         self.assertEqual(handler._common_prefix_length("hello world", "hello there"), 6)
         self.assertEqual(handler._common_prefix_length("abc", "xyz"), 0)
+        self.assertEqual(handler._common_prefix_length("abcdefgh", "abcdefgX"), 7)
+        self.assertEqual(handler._common_prefix_length("aXcdefgh", "abcdefgh"), 1)
+
+    @patch('builtins.print')
+    def test_common_prefix_length_matches_character_scan(self, mock_print):
+        """Slice-based search agrees with a plain character scan at every split."""
+        handler = StreamingOutputHandler()
+        base = "the quick brown fox jumps over the lazy dog"
+
+        for i in range(len(base) + 1):
+            changed = base[:i] + "#" + base[i + 1:]
+            self.assertEqual(handler._common_prefix_length(base, changed), min(i, len(base)))
+            self.assertEqual(handler._common_prefix_length(base, base[:i]), i)
 
 
 if __name__ == "__main__":
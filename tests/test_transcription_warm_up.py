@@ -0,0 +1,59 @@
+"""Tests for warming local transcription models after initialization."""
+
+import threading
+import numpy as np
+from unittest.mock import Mock, patch
+from microphone_audio_source import MicrophoneAudioSource
+from transcription.base import TranscriptionAudioSource
+
+
+class RecordingTranscriber(TranscriptionAudioSource):
+    """Transcription source that records the audio it is asked to transcribe."""
+
+    WARM_UP_ON_INITIALIZE = True
+
+    def __init__(self, config):
+        super().__init__(config, "test-model", dtype='float32')
+        self.calls = []
+        self.done = threading.Event()
+
+    def _transcribe_audio(self, audio_data):
+        self.calls.append(audio_data)
+        self.done.set()
+        return ""
+
+
+def _config():
+    return Mock(sample_rate=16000, channels=1)
+
+
+@patch.object(MicrophoneAudioSource, 'initialize', return_value=True)
+def test_initialize_runs_warm_up_inference(_):
+    """A successful initialize transcribes a short silence in the background."""
+    source = RecordingTranscriber(_config())
+
+    assert source.initialize() is True
+    assert source.done.wait(timeout=2.0)
+    assert len(source.calls) == 1
+    assert source.calls[0].dtype == np.float32
+    assert len(source.calls[0]) == 8000
+    assert not source.calls[0].any()
+
+
+@patch.object(MicrophoneAudioSource, 'initialize', return_value=False)
+def test_no_warm_up_when_initialize_fails(_):
+    """Nothing is transcribed if the microphone could not be initialized."""
+    source = RecordingTranscriber(_config())
+
+    assert source.initialize() is False
+    assert not source.done.wait(timeout=0.1)
+
+
+@patch.object(MicrophoneAudioSource, 'initialize', return_value=True)
+def test_warm_up_is_opt_in(_):
+    """Sources that do not opt in (e.g. remote APIs) are not called at startup."""
+    source = RecordingTranscriber(_config())
+    source.WARM_UP_ON_INITIALIZE = False
+
+    assert source.initialize() is True
+    assert not source.done.wait(timeout=0.1)
@@ -129,9 +129,9 @@ class TestHuggingFaceTranscriptionAudioSourceMocked(unittest.TestCase):
         self.model_instance.assert_called()
 
     def test_stop_recording_with_audio(self):
-        """Test stop_recording returns AudioTextResult with phonemes."""
+        """Test stop_recording defers transcription to an AudioTextResult with phonemes."""
         from transcription.implementations.huggingface import HuggingFaceCTCTranscriptionAudioSource
-        from audio_source import AudioDataResult, AudioTextResult
+        from audio_source import AudioDataResult, AudioTextResult, AudioPendingTextResult
 
         audio_source = HuggingFaceCTCTranscriptionAudioSource(self.config, "test_model")
 
@@ -141,9 +141,13 @@ class TestHuggingFaceTranscriptionAudioSourceMocked(unittest.TestCase):
 
         with patch('microphone_audio_source.MicrophoneAudioSource.stop_recording', return_value=mock_audio_result):
             # Mock the _transcribe_audio method
-            with patch.object(audio_source, '_transcribe_audio', return_value="t ɛ s t"):
-                result = audio_source.stop_recording()
+            with patch.object(audio_source, '_transcribe_audio', return_value="t ɛ s t") as transcribe:
+                pending = audio_source.stop_recording()
 
+                self.assertIsInstance(pending, AudioPendingTextResult)
+                transcribe.assert_not_called()
+
+                result = pending.transcribe()
                 self.assertIsInstance(result, AudioTextResult)
                 self.assertEqual(result.transcribed_text, "<tx>t ɛ s t</tx>")
                 self.assertEqual(result.sample_rate, 16000)
@@ -0,0 +1,91 @@
+"""Tests for the in-memory WAV encoders."""
+
+import io
+import struct
+import numpy as np
+import pytest
+import soundfile as sf
+from lib.wav_encoder import encode_mulaw_wav, encode_pcm16_wav, encode_pcm16_wav_view, WAV_HEADER_SIZE
+
+
+def test_mono_round_trips_through_soundfile():
+    """Encoded mono audio decodes to the same samples and rate."""
+    audio = np.arange(-500, 500, dtype=np.int16)
+
+    wav = encode_pcm16_wav(audio, 16000)
+
+    assert len(wav) == WAV_HEADER_SIZE + audio.nbytes
+    decoded, sample_rate = sf.read(io.BytesIO(wav), dtype='int16')
+    assert sample_rate == 16000
+    assert np.array_equal(decoded, audio)
+
+
+def test_multichannel_frames_interleaved():
+    """(frames, channels) input is stored as interleaved frames."""
+    audio = np.arange(20, dtype=np.int16).reshape(10, 2)
+
+    decoded, _ = sf.read(io.BytesIO(encode_pcm16_wav(audio, 8000)), dtype='int16')
+
+    assert decoded.shape == (10, 2)
+    assert np.array_equal(decoded, audio)
+
+
+def test_non_int16_rejected():
+    """Float audio must be converted by the caller."""
+    with pytest.raises(TypeError):
+        encode_pcm16_wav(np.zeros(4, dtype=np.float32), 16000)
+
+
+def test_strided_view_encoded_in_frame_order():
+    """Non-contiguous views (e.g. one channel of stereo) encode their own samples."""
+    stereo = np.arange(20, dtype=np.int16).reshape(10, 2)
+    left = stereo[:, 0]
+
+    decoded, _ = sf.read(io.BytesIO(encode_pcm16_wav(left, 8000)), dtype='int16')
+
+    assert np.array_equal(decoded, left)
+
+
+def test_view_encoding_matches_bytes_and_reuses_buffer():
+    """View encoder produces identical bytes and reuses storage for shorter audio."""
+    long_audio = np.arange(1000, dtype=np.int16)
+    short_audio = np.arange(10, dtype=np.int16).reshape(5, 2)
+
+    first = encode_pcm16_wav_view(long_audio, 16000)
+    assert bytes(first) == encode_pcm16_wav(long_audio, 16000)
+
+    second = encode_pcm16_wav_view(short_audio, 8000)
+    assert bytes(second) == encode_pcm16_wav(short_audio, 8000)
+    assert second.obj is first.obj
+
+
+def test_mulaw_known_codes_and_soundfile_decoding():
+    """Mu-law output uses G.711 codes and decodes as a U-Law WAV at one byte per sample."""
+    audio = np.array([0, -1, 32767, -32768, 1000, -1000], dtype=np.int16)
+
+    wav = encode_mulaw_wav(audio, 16000)
+
+    info = sf.info(io.BytesIO(wav))
+    assert info.subtype == 'ULAW'
+    assert info.frames == len(audio)
+    assert list(wav[-len(audio):]) == [0xFF, 0x7E, 0x80, 0x00, 0xCE, 0x4E]
+
+    decoded, sample_rate = sf.read(io.BytesIO(wav), dtype='int16')
+    assert sample_rate == 16000
+    # Companding error grows with amplitude: about 3% of the sample near full scale
+    assert np.all(np.abs(decoded.astype(np.int32) - audio) <= np.abs(audio.astype(np.int32)) // 32 + 8)
+
+
+def test_mulaw_odd_sample_count_padded():
+    """An odd-sized data chunk gets a pad byte counted in the RIFF size but not the data size."""
+    audio = np.array([0, 1000, -1000], dtype=np.int16)
+
+    wav = encode_mulaw_wav(audio, 8000)
+
+    assert len(wav) % 2 == 0
+    assert wav[-1:] == b'\x00'
+    assert struct.unpack_from('<I', wav, 4)[0] == len(wav) - 8
+    assert struct.unpack_from('<I', wav, len(wav) - 1 - len(audio) - 4)[0] == len(audio)
+
+    decoded, _ = sf.read(io.BytesIO(wav), dtype='int16')
+    assert len(decoded) == len(audio)
@@ -92,6 +92,27 @@ class TestWindowsKeyboardInjector(unittest.TestCase):
                         mock_unicode.assert_any_call("line2")
                         self.assertEqual(mock_key.call_count, 2)
 
+    def test_send_unicode_batches_line(self):
+        """A line goes out as one SendInput call with a down and up event per character."""
+        injector = self.WindowsKeyboardInjector()
+        user32 = MagicMock()
+        user32.SendInput.return_value = 6
+        with patch.multiple('keyboard_injector_windows', user32=user32,
+                            KEYBDINPUT=MagicMock(), INPUT=MagicMock()):
+            injector._send_unicode("abc")
+        user32.SendInput.assert_called_once()
+        self.assertEqual(user32.SendInput.call_args[0][0], 6)
+
+    def test_send_unicode_partial_send_raises(self):
+        """Fewer events accepted than sent is reported as an error."""
+        injector = self.WindowsKeyboardInjector()
+        user32 = MagicMock()
+        user32.SendInput.return_value = 1
+        with patch.multiple('keyboard_injector_windows', user32=user32,
+                            KEYBDINPUT=MagicMock(), INPUT=MagicMock()):
+            with self.assertRaises(RuntimeError):
+                injector._send_unicode("ab")
+
     def test_emit_empty(self):
         """Test emit with empty string."""
         injector = self.WindowsKeyboardInjector()
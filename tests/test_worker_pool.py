@@ -0,0 +1,98 @@
+"""Tests for WorkerPool persistent workers."""
+
+import threading
+from lib.worker_pool import WorkerPool
+
+
+def test_submitted_calls_run_with_arguments():
+    """Each submit() calls the processor with its arguments."""
+    results = []
+    done = threading.Semaphore(0)
+
+    def processor(a, b):
+        results.append(a + b)
+        done.release()
+
+    pool = WorkerPool(processor, 2, name="ArgsTest")
+    pool.start()
+    try:
+        pool.submit(1, 2)
+        pool.submit(10, 20)
+        assert done.acquire(timeout=2.0)
+        assert done.acquire(timeout=2.0)
+        assert sorted(results) == [3, 30]
+    finally:
+        pool.shutdown()
+
+
+def test_workers_run_concurrently_and_are_reused():
+    """Blocked item does not stop another worker; threads persist across items."""
+    release = threading.Event()
+    second_ran = threading.Event()
+    thread_names = []
+
+    def processor(item):
+        thread_names.append(threading.current_thread().name)
+        if item == "slow":
+            release.wait(timeout=2.0)
+        else:
+            second_ran.set()
+
+    pool = WorkerPool(processor, 2, name="ConcurrencyTest")
+    pool.start()
+    try:
+        pool.submit("slow")
+        pool.submit("fast")
+        assert second_ran.wait(timeout=1.0)
+        release.set()
+    finally:
+        pool.shutdown()
+
+    assert set(thread_names) <= {"ConcurrencyTest-0", "ConcurrencyTest-1"}
+    assert not pool.is_running()
+
+
+def test_processor_error_keeps_worker_alive():
+    """Exception in one call does not kill the worker."""
+    done = threading.Event()
+
+    def processor(item):
+        if item == "bad":
+            raise RuntimeError("boom")
+        done.set()
+
+    pool = WorkerPool(processor, 1, name="ErrorTest")
+    pool.start()
+    try:
+        pool.submit("bad")
+        pool.submit("good")
+        assert done.wait(timeout=2.0)
+    finally:
+        pool.shutdown()
+
+
+def test_initializer_runs_once_per_worker_before_items():
+    """Each worker thread calls the initializer before processing."""
+    initialized = []
+    processed = []
+    done = threading.Event()
+
+    def initializer():
+        initialized.append(threading.current_thread().name)
+
+    def processor(item):
+        processed.append((item, threading.current_thread().name in initialized))
+        if len(processed) == 3:
+            done.set()
+
+    pool = WorkerPool(processor, 2, name="InitTest", initializer=initializer)
+    pool.start()
+    try:
+        for i in range(3):
+            pool.submit(i)
+        assert done.wait(timeout=2.0)
+    finally:
+        pool.shutdown()
+
+    assert sorted(initialized) == ["InitTest-0", "InitTest-1"]
+    assert all(ready for _, ready in processed)
@@ -0,0 +1,173 @@
+"""Tests for XdotoolKeyboardInjector command batching and background typing."""
+
+import unittest
+import sys
+import os
+import subprocess
+import threading
+from unittest.mock import patch, MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+
+from keyboard_injector_xdotool import XdotoolKeyboardInjector, ModifierStateTracker
+
+
+class TestXdotoolBatching(unittest.TestCase):
+    """Buffered operations are sent as few xdotool invocations on flush."""
+
+    def setUp(self):
+        """Create an injector outside test mode whose xdotool calls are captured."""
+        with patch('keyboard_injector_xdotool.ModifierStateTracker'):
+            self.injector = XdotoolKeyboardInjector(typing_delay=5)
+        self.injector.test_mode = False
+        self.commands = []
+        self.injector._run_xdotool = self.commands.append
+
+    def _flush(self):
+        self.injector.flush()
+        self.assertTrue(self.injector.wait_until_typed(timeout=2.0))
+
+    def test_nothing_sent_before_flush(self):
+        """bksp() and emit() only buffer."""
+        self.injector.bksp(3)
+        self.injector.emit("hello ")
+        self.assertEqual(self.commands, [])
+
+    def test_backspace_and_text_in_one_invocation(self):
+        """Backspaces and the following words go out as one chained command."""
+        self.injector.bksp(3)
+        self.injector.emit("hello ")
+        self.injector.emit("world ")
+        self._flush()
+
+        self.assertEqual(self.commands, [[
+            "xdotool",
+            "key", "--delay", "5", "--repeat", "3", "BackSpace",
+            "type", "--delay", "5", "--", "hello world ",
+        ]])
+
+    def test_backspace_over_pending_text_cancels_it(self):
+        """Deleting text not yet typed drops it instead of typing then erasing."""
+        self.injector.emit("abc")
+        self.injector.bksp(5)
+        self.injector.emit("xy")
+        self._flush()
+
+        self.assertEqual(self.commands, [[
+            "xdotool",
+            "key", "--delay", "5", "--repeat", "2", "BackSpace",
+            "type", "--delay", "5", "--", "xy",
+        ]])
+
+    def test_newlines_press_return_between_lines(self):
+        """Each typed line ends an invocation; Return leads the next one."""
+        self.injector.emit("one\ntwo\n")
+        self._flush()
+
+        self.assertEqual(self.commands, [
+            ["xdotool", "type", "--delay", "5", "--", "one"],
+            ["xdotool", "key", "Return", "type", "--delay", "5", "--", "two"],
+            ["xdotool", "key", "Return"],
+        ])
+
+    def test_flush_clears_buffer(self):
+        """A second flush with nothing pending sends nothing."""
+        self.injector.emit("hi")
+        self._flush()
+        self._flush()
+        self.assertEqual(len(self.commands), 1)
+
+    def test_typing_runs_off_the_flushing_thread(self):
+        """xdotool is invoked from the typing thread, not the caller."""
+        threads = []
+        self.injector._run_xdotool = lambda cmd: threads.append(threading.current_thread().name)
+        self.injector.emit("hi")
+        self._flush()
+        self.assertEqual(threads, ["XdotoolTyper"])
+
+    def test_updates_flushed_during_a_run_are_merged(self):
+        """While one run is in progress, later flushes coalesce into a single run."""
+        started, release = threading.Event(), threading.Event()
+
+        def slow_run(cmd):
+            self.commands.append(cmd)
+            started.set()
+            release.wait(2.0)
+
+        self.injector._run_xdotool = slow_run
+        self.injector.emit("one ")
+        self.injector.flush()
+        self.assertTrue(started.wait(2.0))
+
+        self.injector.emit("two ")
+        self.injector.flush()
+        self.injector.bksp(2)
+        self.injector.emit("o three ")
+        self.injector.flush()
+        release.set()
+        self.assertTrue(self.injector.wait_until_typed(timeout=2.0))
+
+        self.assertEqual(self.commands, [
+            ["xdotool", "type", "--delay", "5", "--", "one "],
+            ["xdotool", "type", "--delay", "5", "--", "two three "],
+        ])
+
+
+class TestXdotoolInvocation(unittest.TestCase):
+    """xdotool is run without capturing or decoding its output."""
+
+    def setUp(self):
+        with patch('keyboard_injector_xdotool.ModifierStateTracker'):
+            self.injector = XdotoolKeyboardInjector(typing_delay=5)
+
+    def test_stdout_discarded_stderr_kept_raw(self):
+        """Only stderr is piped, as bytes, for error reporting."""
+        with patch('keyboard_injector_xdotool.subprocess.run') as run:
+            self.injector._run_xdotool(["xdotool", "key", "Return"])
+
+        kwargs = run.call_args.kwargs
+        self.assertIs(kwargs['stdout'], subprocess.DEVNULL)
+        self.assertIs(kwargs['stderr'], subprocess.PIPE)
+        self.assertNotIn('text', kwargs)
+        self.assertNotIn('capture_output', kwargs)
+
+    def test_failure_reports_stderr(self):
+        """A failing command logs xdotool's own error message."""
+        error = subprocess.CalledProcessError(1, ["xdotool"], stderr=b"Can't open display")
+        with patch('keyboard_injector_xdotool.subprocess.run', side_effect=error), \
+                patch('keyboard_injector_xdotool.pr_err') as pr_err:
+            self.injector._run_xdotool(["xdotool", "key", "Return"])
+
+        self.assertIn("Can't open display", pr_err.call_args[0][0])
+
+
+class TestModifierStateTracker(unittest.TestCase):
+    """Modifier state follows press/release of any variant of each modifier."""
+
+    def setUp(self):
+        # Stand-in keys: with the dummy pynput backend every Key member compares equal
+        with patch('keyboard_injector_xdotool.keyboard.Listener'):
+            self.tracker = ModifierStateTracker()
+        self.tracker._MODIFIER_KEYS = {'ctrl_l': 'ctrl', 'shift_r': 'shift'}
+
+    def test_waits_until_all_modifiers_released(self):
+        """The no-modifiers event clears on press and sets after the last release."""
+        self.tracker._on_press('ctrl_l')
+        self.tracker._on_press('shift_r')
+        self.assertFalse(self.tracker._no_modifiers_event.is_set())
+
+        self.tracker._on_release('ctrl_l')
+        self.assertFalse(self.tracker._no_modifiers_event.is_set())
+        self.tracker._on_release('shift_r')
+        self.assertTrue(self.tracker._no_modifiers_event.is_set())
+
+    def test_other_keys_ignored(self):
+        """Non-modifier keys do not change modifier state."""
+        self.tracker._on_press('a')
+        self.tracker._on_release('space')
+        self.assertTrue(self.tracker._no_modifiers_event.is_set())
+        self.assertFalse(any(self.tracker._modifiers.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
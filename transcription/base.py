@@ -1,15 +1,20 @@
 """Base class for transcription audio sources."""
 
 import sys
+import threading
 import time
 import numpy as np
 from abc import abstractmethod
 from typing import Optional
-from audio_source import AudioResult, AudioTextResult, AudioChunkHandler
+from audio_source import AudioResult, AudioTextResult, AudioPendingTextResult, AudioChunkHandler
 from microphone_audio_source import MicrophoneAudioSource
 
 sys.path.insert(0, 'lib')
-from pr_log import pr_info
+from pr_log import pr_info, pr_debug
+
+
+# 1/32768 is a power of two, so multiplying is exact and matches division
+INT16_TO_FLOAT32_SCALE = np.float32(1.0 / 32768.0)
 
 
 def parse_transcription_model(transcription_model: str) -> str:
@@ -42,6 +47,10 @@ class TranscriptionAudioSource(MicrophoneAudioSource):
     Subclasses implement _transcribe_audio() to perform actual transcription.
     """
 
+    # Local models set this to run one throwaway inference after initialize()
+    WARM_UP_ON_INITIALIZE = False
+    WARM_UP_SECONDS = 0.5
+
     def __init__(self, config, model_identifier: str, supports_streaming: bool = False,
                  dtype: str = 'int16', chunk_handler: Optional[AudioChunkHandler] = None):
         """
@@ -59,6 +68,7 @@ class TranscriptionAudioSource(MicrophoneAudioSource):
         self.supports_streaming = supports_streaming
         self.transcription_start_time = None
         self.transcription_end_time = None
+        self._transcribe_lock = threading.Lock()
 
     @abstractmethod
     def _transcribe_audio(self, audio_data: np.ndarray) -> str:
@@ -76,42 +86,88 @@ class TranscriptionAudioSource(MicrophoneAudioSource):
         """
         pass
 
+    def initialize(self) -> bool:
+        """Initialize the microphone, then warm the model in the background if enabled."""
+        if not super().initialize():
+            return False
+        if self.WARM_UP_ON_INITIALIZE:
+            threading.Thread(target=self._warm_up, name="TranscriptionWarmup", daemon=True).start()
+        return True
+
+    def _warm_up(self) -> None:
+        """
+        Transcribe a short silence so the first dictation skips one-time setup.
+
+        The first inference pays for allocator growth and kernel selection.
+        Holding the transcription lock means a recording that finishes during
+        warm-up waits for it instead of running cold alongside it.
+        """
+        silence = np.zeros(int(self.WARM_UP_SECONDS * self.config.sample_rate), dtype=self.dtype)
+        try:
+            with self._transcribe_lock:
+                self._transcribe_audio(silence)
+            pr_debug(f"Transcription model warmed: {self.model_identifier}")
+        except Exception as e:
+            pr_debug(f"Transcription model warm-up failed: {e}")
+
     def stop_recording(self) -> AudioResult:
-        """Stop recording and return transcribed text result."""
+        """
+        Stop recording and return the text result.
+
+        Batch sources return an AudioPendingTextResult so the caller is not
+        blocked on the model; streaming sources finish decoding here.
+        """
         audio_result = super().stop_recording()
 
         if hasattr(audio_result, 'audio_data') and len(audio_result.audio_data) > 0:
             if self.chunk_handler and hasattr(self.chunk_handler, 'end_streaming'):
                 self.chunk_handler.end_streaming()
 
+            if not self.supports_streaming:
+                return AudioPendingTextResult(
+                    audio_data=audio_result.audio_data,
+                    sample_rate=self.config.sample_rate,
+                    transcriber=self.transcribe_recording
+                )
+            return self.transcribe_recording(audio_result.audio_data)
+        else:
+            return AudioTextResult(
+                transcribed_text="",
+                sample_rate=self.config.sample_rate,
+                audio_data=np.array([], dtype=self.dtype)
+            )
+
+    def transcribe_recording(self, audio_data: np.ndarray) -> AudioTextResult:
+        """
+        Transcribe a finished recording into a formatted text result.
+
+        Serialized per source: deferred results may be transcribed from
+        several worker threads, and model state is not shared safely.
+        """
+        with self._transcribe_lock:
             pr_info(f"Transcribing with {self.model_identifier}...")
 
             self.transcription_start_time = time.time()
-            transcribed_text = self._transcribe_audio(audio_result.audio_data)
+            transcribed_text = self._transcribe_audio(audio_data)
             self.transcription_end_time = time.time()
 
-            elapsed_ms = int((self.transcription_end_time - self.transcription_start_time) * 1000)
-            pr_info(f"Transcription completed ({elapsed_ms}ms)")
+        elapsed_ms = int((self.transcription_end_time - self.transcription_start_time) * 1000)
+        pr_info(f"Transcription completed ({elapsed_ms}ms)")
 
-            formatted_text = f"<tx>{transcribed_text}</tx>" if transcribed_text else ""
+        formatted_text = f"<tx>{transcribed_text}</tx>" if transcribed_text else ""
 
-            return AudioTextResult(
-                transcribed_text=formatted_text,
-                sample_rate=self.config.sample_rate,
-                audio_data=audio_result.audio_data
-            )
-        else:
-            return AudioTextResult(
-                transcribed_text="",
-                sample_rate=self.config.sample_rate,
-                audio_data=np.array([], dtype=self.dtype)
-            )
+        return AudioTextResult(
+            transcribed_text=formatted_text,
+            sample_rate=self.config.sample_rate,
+            audio_data=audio_data
+        )
 
     @staticmethod
     def normalize_to_float32(audio_data: np.ndarray) -> np.ndarray:
         """Convert audio data to float32 normalized to [-1, 1]."""
         if audio_data.dtype != np.float32:
-            return audio_data.astype(np.float32) / 32768.0
+            # Cast and scale in one ufunc pass: single output allocation, no temporary
+            return np.multiply(audio_data, INT16_TO_FLOAT32_SCALE, dtype=np.float32)
         return audio_data
 
     @staticmethod
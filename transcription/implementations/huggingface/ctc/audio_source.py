@@ -31,6 +31,8 @@ from ..processor_utils import load_processor_with_fallback
 class HuggingFaceCTCTranscriptionAudioSource(TranscriptionAudioSource):
     """HuggingFace CTC transcription implementation."""
 
+    WARM_UP_ON_INITIALIZE = True
+
     def __init__(self, config, transcription_model_or_model, processor=None):
         """
         Initialize CTC transcription audio source.
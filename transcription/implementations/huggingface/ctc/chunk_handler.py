@@ -21,6 +21,7 @@ except ImportError:
     HfApi = None
 
 from audio_source import AudioChunkHandler
+from transcription.base import INT16_TO_FLOAT32_SCALE
 from lib.pr_log import pr_err, pr_warn, pr_info
 from ..processor_utils import load_processor_with_fallback
 
@@ -99,9 +100,7 @@ class CTCChunkHandler(AudioChunkHandler):
             if chunk.size == 0 or len(chunk) < 10:
                 return
 
-            if chunk.dtype != np.float32:
-                chunk = chunk.astype(np.float32) / 32768.0
-
+            # Conversion to float32 is deferred to finalize() and done once
             self.accumulated_audio.append(chunk)
 
         except Exception as e:
@@ -114,7 +113,7 @@ class CTCChunkHandler(AudioChunkHandler):
                 self.is_complete = True
                 return ""
 
-            full_audio = np.concatenate(self.accumulated_audio)
+            full_audio = self._assemble_float32(self.accumulated_audio)
 
             min_samples = max(320, self.sample_rate // 50)
             if len(full_audio) < min_samples:
@@ -142,3 +141,25 @@ class CTCChunkHandler(AudioChunkHandler):
             pr_err(f"Error finalizing CTC transcription: {e}")
             self.is_complete = True
             return ""
+
+    @staticmethod
+    def _assemble_float32(chunks: list) -> np.ndarray:
+        """
+        Join chunks into one float32 array, converting int16 samples in place.
+
+        Each chunk is written straight into a pre-sized output, so the audio
+        is copied once instead of concatenated and then converted.
+        """
+        first = chunks[0]
+        total = sum(len(chunk) for chunk in chunks)
+        full_audio = np.empty((total,) + first.shape[1:], dtype=np.float32)
+
+        pos = 0
+        for chunk in chunks:
+            end = pos + len(chunk)
+            if chunk.dtype == np.float32:
+                full_audio[pos:end] = chunk
+            else:
+                np.multiply(chunk, INT16_TO_FLOAT32_SCALE, out=full_audio[pos:end], dtype=np.float32)
+            pos = end
+        return full_audio
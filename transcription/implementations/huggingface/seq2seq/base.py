@@ -23,6 +23,8 @@ class HuggingFaceSeq2SeqTranscriptionAudioSource(TranscriptionAudioSource):
     Uses autoregressive generation for transcription.
     """
 
+    WARM_UP_ON_INITIALIZE = True
+
     def __init__(self, config, model, processor):
         """
         Initialize Seq2Seq transcription audio source.
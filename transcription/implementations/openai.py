@@ -8,12 +8,11 @@ from typing import Optional
 
 try:
     import litellm
-    import soundfile as sf
 except ImportError:
     litellm = None
-    sf = None
 
 from transcription.base import TranscriptionAudioSource, parse_transcription_model
+from lib.wav_encoder import encode_pcm16_wav
 from lib.pr_log import pr_err, pr_warn, pr_info
 
 
@@ -28,8 +27,6 @@ class OpenAITranscriptionAudioSource(TranscriptionAudioSource):
 
         if litellm is None:
             raise ImportError("litellm library not installed. Install with: pip install litellm")
-        if sf is None:
-            raise ImportError("soundfile library not installed. Install with: pip install soundfile")
 
     def _transcribe_audio(self, audio_data: np.ndarray) -> str:
         """Transcribe audio using OpenAI Whisper API."""
@@ -37,16 +34,14 @@ class OpenAITranscriptionAudioSource(TranscriptionAudioSource):
             if len(audio_data) == 0:
                 return ""
 
-            audio_data = self.normalize_to_float32(audio_data)
+            # int16 is written as PCM_16 directly; no float round trip needed
             audio_data = self.squeeze_to_mono(audio_data)
 
             if not self.validate_audio_length(audio_data, self.config.sample_rate):
                 pr_warn("Audio too short for Whisper")
                 return ""
 
-            audio_bytes = io.BytesIO()
-            sf.write(audio_bytes, audio_data, self.config.sample_rate, format='WAV')
-            audio_bytes.seek(0)
+            audio_bytes = io.BytesIO(encode_pcm16_wav(audio_data, self.config.sample_rate))
             audio_bytes.name = "audio.wav"
 
             transcription_params = {
@@ -69,8 +64,8 @@ class OpenAITranscriptionAudioSource(TranscriptionAudioSource):
     def initialize(self) -> bool:
         """Initialize OpenAI Whisper transcription source."""
         try:
-            if litellm is None or sf is None:
-                pr_err("litellm or soundfile library not available")
+            if litellm is None:
+                pr_err("litellm library not available")
                 return False
 
             if not super().initialize():
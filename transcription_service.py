@@ -13,6 +13,21 @@ from lib.keyboard_injector_windows import WindowsKeyboardInjector
 from instruction_composer import InstructionComposer
 from lib.pr_log import pr_err, pr_warn, pr_notice, pr_debug, pr_info
 
+# Phrases in model conversation output that reset the conversation
+RESET_COMMANDS = (
+    "reset conversation",
+    "clear conversation",
+    "start over",
+    "new conversation",
+    "clear context",
+)
+
+# Compiled once at import; used for every response
+_RESET_COMMAND_RE = re.compile('|'.join(re.escape(command) for command in RESET_COMMANDS), re.IGNORECASE)
+_MODE_RE = re.compile(r'<mode>(\w+)</mode>')
+_CONVERSATION_RE = re.compile(r'<conversation>(.*?)</conversation>', re.DOTALL)
+_RESET_TAG_RE = re.compile(r'<reset\s*/>|<reset>.*?</reset>', re.DOTALL | re.IGNORECASE)
+
 
 class TranscriptionService:
     """Handles XML transcription processing and streaming."""
@@ -42,28 +57,23 @@ class TranscriptionService:
         self.streaming_buffer = ""
         self.last_update_position = 0
         self.update_seen = False
+        # Incremental tag search state: tag -> (first position or -1, next search start)
+        self._tag_scan = {}
+        self._reset_scan_from = 0
+        self._mode_handled = False
+
+        # Derived context strings: (words dict, processor version, value)
+        self._text_cache = (None, -1, "")
+        self._xml_cache = (None, -1, "")
     
     def detect_and_execute_commands(self, text):
         """Detect commands in transcribed text and execute them. Returns the text with commands removed."""
-        # Command patterns to detect
-        reset_patterns = [
-            "reset conversation",
-            "clear conversation", 
-            "start over",
-            "new conversation",
-            "clear context"
-        ]
-        
-        text_lower = text.lower().strip()
-        
-        # Check for reset commands
-        for pattern in reset_patterns:
-            if pattern in text_lower:
-                pr_notice(f"Command detected: '{pattern}' - Resetting conversation...")
-                self.reset_all_state()
-                text = re.sub(re.escape(pattern), '', text, flags=re.IGNORECASE).strip()
-                break
-        
+        match = _RESET_COMMAND_RE.search(text)
+        if match:
+            pr_notice(f"Command detected: '{match.group(0).lower()}' - Resetting conversation...")
+            self.reset_all_state()
+            text = (text[:match.start()] + text[match.end():]).strip()
+
         return text
     
     def reset_streaming_state(self):
@@ -71,6 +81,9 @@ class TranscriptionService:
         self.streaming_buffer = ""
         self.last_update_position = 0
         self.update_seen = False
+        self._tag_scan = {}
+        self._reset_scan_from = 0
+        self._mode_handled = False
         # Reset processor state if --once flag is enabled
         if getattr(self.config, 'reset_state_each_response', False):
             self.processor.reset({})
@@ -95,6 +108,8 @@ class TranscriptionService:
 
             # Always call end_stream to flush XMLStreamProcessor state
             self.processor.end_stream()
+            # Injectors may type on their own thread; the stream is done once they have
+            self.processor.keyboard.wait_until_typed()
 
             if self.config.debug_enabled:
                 pr_debug("complete_stream: stream completed")
@@ -104,6 +119,10 @@ class TranscriptionService:
             self.processor._flush_debug_buffer()
             raise
     
+    def wait_until_typed(self, timeout=None):
+        """Wait for keyboard output still being typed; returns False on timeout."""
+        return self.processor.keyboard.wait_until_typed(timeout)
+
     def _handle_mode_change(self, new_mode: str):
         """Reset state for new mode."""
         if not self.composer:
@@ -129,14 +148,36 @@ class TranscriptionService:
         pr_notice(f"Mode switched to: {new_mode}")
         return True
 
+    def _find_in_stream(self, tag):
+        """
+        Position of the first tag in the streaming buffer, or -1.
+
+        Each call searches only text appended since the last one, starting
+        a tag's length before the old end so a tag split across chunks is
+        still found. A found position is kept until the stream is reset.
+        """
+        position, scan_from = self._tag_scan.get(tag, (-1, 0))
+        if position == -1:
+            buffer = self.streaming_buffer
+            position = buffer.find(tag, scan_from)
+            self._tag_scan[tag] = (position, max(0, len(buffer) - len(tag) + 1))
+        return position
+
     def process_streaming_chunk(self, chunk_text):
         """Process streaming text chunks and apply real-time updates."""
+        if not chunk_text:
+            return
+
         try:
-            # Detect mode changes in the stream
-            if '<mode>' in self.streaming_buffer or '<mode>' in chunk_text:
-                combined = self.streaming_buffer + chunk_text
-                mode_match = re.search(r'<mode>(\w+)</mode>', combined)
+            # Add chunk to buffer; everything below reads the combined text from here
+            self.streaming_buffer += chunk_text
+
+            # Detect mode changes in the stream (acted on once per stream)
+            mode_start = -1 if self._mode_handled else self._find_in_stream('<mode>')
+            if mode_start != -1:
+                mode_match = _MODE_RE.match(self.streaming_buffer, mode_start)
                 if mode_match:
+                    self._mode_handled = True
                     new_mode = mode_match.group(1)
                     result = self._handle_mode_change(new_mode)
                     if result is True:
@@ -147,25 +188,27 @@ class TranscriptionService:
             if not self.processor.streaming_active and '<update>' in chunk_text:
                 self.processor.start_stream()
 
-            # Add chunk to buffer
-            self.streaming_buffer += chunk_text
-
             # Detect and handle <reset> tags in the stream
-            if '<reset' in self.streaming_buffer:
-                # Find last reset tag
-                last_reset_idx = self.streaming_buffer.rfind('<reset')
-                if last_reset_idx != -1:
-                    # Look for end of reset tag
-                    reset_end = self.streaming_buffer.find('>', last_reset_idx)
-                    if reset_end != -1:
-                        self.reset_all_state()
-                        # Keep content after reset tag
-                        self.streaming_buffer = self.streaming_buffer[reset_end + 1:]
-                        self.last_update_position = 0
-                        self.update_seen = False
+            # Find last reset tag; earlier complete ones were already cut away
+            last_reset_idx = self.streaming_buffer.rfind('<reset', self._reset_scan_from)
+            if last_reset_idx == -1:
+                self._reset_scan_from = max(0, len(self.streaming_buffer) - len('<reset') + 1)
+            else:
+                # Look for end of reset tag
+                reset_end = self.streaming_buffer.find('>', last_reset_idx)
+                if reset_end != -1:
+                    self.reset_all_state()
+                    # Keep content after reset tag
+                    self.streaming_buffer = self.streaming_buffer[reset_end + 1:]
+                    self.last_update_position = 0
+                    self.update_seen = False
+                else:
+                    # Tag still open; resume here once the rest arrives
+                    self._reset_scan_from = last_reset_idx
 
             # Handle incremental streaming after <update> tag
-            if '<update>' in self.streaming_buffer:
+            update_idx = self._find_in_stream('<update>')
+            if update_idx != -1:
                 # Check if this is a new update section (complete <update>...</update> in current chunk)
                 if '</update>' in chunk_text and '<update>' in chunk_text:
                     # This chunk contains a complete update section - reset and process it
@@ -188,12 +231,11 @@ class TranscriptionService:
                 if not self.update_seen:
                     # First time seeing update tag
                     self.update_seen = True
-                    update_idx = self.streaming_buffer.find('<update>')
                     self.last_update_position = update_idx + 8  # len('<update>')
 
                 # Stream new content only (content after last processed position)
                 # Respect update boundaries - don't send content past </update>
-                update_end_pos = self.streaming_buffer.find('</update>')
+                update_end_pos = self._find_in_stream('</update>')
 
                 if update_end_pos == -1:
                     # No closing tag yet, process up to current buffer end
@@ -219,23 +261,26 @@ class TranscriptionService:
     
     def process_xml_transcription(self, text):
         """Process XML transcription text using the word processing pipeline."""
+        if not text or '<' not in text:
+            # No tags to parse; only finish the stream
+            self.processor.end_stream()
+            return
+
         try:
             # Detect and handle mode changes
-            mode_match = re.search(r'<mode>(\w+)</mode>', text)
+            mode_match = _MODE_RE.search(text)
             if mode_match:
                 new_mode = mode_match.group(1)
                 if self._handle_mode_change(new_mode):
                     return  # Skip content processing for mode changes
 
             # Check for conversation tags first
-            conversation_pattern = re.compile(r'<conversation>(.*?)</conversation>', re.DOTALL)
-            conversation_matches = conversation_pattern.findall(text)
+            conversation_matches = _CONVERSATION_RE.findall(text)
 
             # Detect and handle <reset> tags before processing words
-            reset_pattern = re.compile(r'<reset\s*/>|<reset>.*?</reset>', re.DOTALL | re.IGNORECASE)
-            if reset_pattern.search(text):
+            if _RESET_TAG_RE.search(text):
                 self.reset_all_state()
-                text = reset_pattern.sub('', text)
+                text = _RESET_TAG_RE.sub('', text)
             
             # Process conversation content
             for conversation_content in conversation_matches:
@@ -247,7 +292,7 @@ class TranscriptionService:
                         pr_info(f"AI: {cleaned_content}")
             
             # Remove conversation tags from text before processing words
-            text_without_conversation = conversation_pattern.sub('', text)
+            text_without_conversation = _CONVERSATION_RE.sub('', text)
             
             # Use XMLStreamProcessor for final processing
             self.processor.process_chunk(text_without_conversation)
@@ -257,20 +302,33 @@ class TranscriptionService:
             pr_err(f"Error processing XML transcription: {e}")
     
     def _build_current_text(self):
-        """Build current text from XMLStreamProcessor state."""
-        return self.processor._build_string_from_words(self.processor.current_words)
+        """Build current text from XMLStreamProcessor state (cached until the words change)."""
+        words = self.processor.current_words
+        version = self.processor.version
+        cached_words, cached_version, text = self._text_cache
+        if cached_words is words and cached_version == version:
+            return text
+
+        text = self.processor._build_string_from_words(words)
+        self._text_cache = (words, version, text)
+        return text
     
     def _build_xml_from_processor(self):
-        """Build XML markup from XMLStreamProcessor state."""
-        if not self.processor.current_words:
-            return ""
-        
-        # Build XML with proper escaping
+        """Build XML markup from XMLStreamProcessor state (cached until the words change)."""
+        words = self.processor.current_words
+        version = self.processor.version
+        cached_words, cached_version, xml_markup = self._xml_cache
+        if cached_words is words and cached_version == version:
+            return xml_markup
+
+        # Build XML with proper escaping, in the processor's already-sorted sequence order
         xml_parts = []
-        for word_id in sorted(self.processor.current_words.keys()):
-            text = self.processor.current_words[word_id]
+        for word_id in self.processor._sorted_seqs():
+            text = words[word_id]
             # Basic XML escaping
             escaped_text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
             xml_parts.append(f'<{word_id}>{escaped_text}</{word_id}>')
-        
-        return ''.join(xml_parts)
\ No newline at end of file
+
+        xml_markup = ''.join(xml_parts)
+        self._xml_cache = (words, version, xml_markup)
+        return xml_markup
\ No newline at end of file